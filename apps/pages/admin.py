@@ -1,6 +1,10 @@
 from django.contrib import admin
 from django.utils.html import format_html
-from .models import SuccessStory, Partner, EUProject, GalleryEvent, GalleryPhoto, Program, Statistic, Mentor, News, NewsImage, Document
+from . import tasks
+from .models import (
+    SuccessStory, Partner, EUProject, GalleryEvent, GalleryPhoto, Program, Statistic, Mentor, News, NewsImage,
+    Document, ImageTask,
+)
 
 
 @admin.register(SuccessStory)
@@ -43,8 +47,8 @@ class EUProjectAdmin(admin.ModelAdmin):
 class GalleryPhotoInline(admin.TabularInline):
     model = GalleryPhoto
     extra = 1
-    fields = ['image', 'caption', 'order', 'image_preview']
-    readonly_fields = ['image_preview']
+    fields = ['image', 'caption', 'order', 'processing_status', 'image_preview']
+    readonly_fields = ['processing_status', 'image_preview']
 
     def image_preview(self, obj):
         if obj.image:
@@ -68,9 +72,9 @@ class GalleryEventAdmin(admin.ModelAdmin):
     cover_preview.short_description = 'Copertă'
 
     def photo_count(self, obj):
-        count = obj.photos.count()
-        return f'{count} foto' if count else '-'
+        return f'{obj.photo_count} foto' if obj.photo_count else '-'
     photo_count.short_description = 'Fotografii'
+    photo_count.admin_order_field = 'photo_count'
 
 
 @admin.register(Program)
@@ -101,8 +105,8 @@ class MentorAdmin(admin.ModelAdmin):
 class NewsImageInline(admin.TabularInline):
     model = NewsImage
     extra = 1
-    fields = ['image', 'caption', 'order', 'image_preview']
-    readonly_fields = ['image_preview']
+    fields = ['image', 'caption', 'order', 'processing_status', 'image_preview']
+    readonly_fields = ['processing_status', 'image_preview']
 
     def image_preview(self, obj):
         if obj.image:
@@ -127,9 +131,9 @@ class NewsAdmin(admin.ModelAdmin):
     image_preview.short_description = 'Foto'
 
     def image_count(self, obj):
-        count = obj.images.count()
-        return f'{count} img' if count else '-'
+        return f'{obj.image_count} img' if obj.image_count else '-'
     image_count.short_description = 'Galerie'
+    image_count.admin_order_field = 'image_count'
 
 
 @admin.register(Document)
@@ -142,3 +146,15 @@ class DocumentAdmin(admin.ModelAdmin):
     def file_type(self, obj):
         return obj.file_extension or '-'
     file_type.short_description = 'Tip'
+
+
+@admin.register(ImageTask)
+class ImageTaskAdmin(admin.ModelAdmin):
+    list_display = ['model_label', 'object_id', 'status', 'attempts', 'created_at', 'updated_at']
+    list_filter = ['status', 'model_label']
+    readonly_fields = ['model_label', 'object_id', 'attempts', 'error', 'created_at', 'updated_at']
+    actions = ['retry']
+
+    @admin.action(description='Reîncearcă sarcinile selectate')
+    def retry(self, request, queryset):
+        tasks.retry(queryset)
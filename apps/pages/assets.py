@@ -0,0 +1,222 @@
+"""Bundling and minification of the site's CSS and JS.
+
+Used by ``storage.BundledManifestStaticFilesStorage`` during collectstatic.
+Bundles are listed in ``settings.STATIC_BUNDLES`` as
+``{bundle path: [source paths]}``.
+
+``precompress()`` then writes ``.gz`` and ``.br`` siblings of the collected
+files for nginx's ``gzip_static``/``brotli_static``.
+
+``vendored_manifest()`` describes the self-hosted fonts, icons and AOS
+written by ``manage.py vendor_assets``; ``parse_icon()`` maps a Font Awesome
+class string to its symbol in the icon sprite.
+
+The minifiers are intentionally conservative: they remove comments and
+whitespace but never rename or reorder anything. The output is still
+valid for any input that was valid before.
+"""
+import gzip
+import hashlib
+import json
+import posixpath
+import re
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+CSS_TOKENS = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|/\*.*?\*/|\s+|[^"\'/\s]+|/', re.S)
+CSS_PUNCTUATION = '{};,>'
+CSS_URL = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+# Images, video and WOFF2 are already compressed; gzip would only add CPU
+PRECOMPRESS_EXTENSIONS = ('.css', '.js', '.json', '.svg', '.ico', '.txt', '.xml', '.map', '.ttf', '.otf', '.eot')
+# Below this nginx's gzip_min_length would not compress either
+PRECOMPRESS_MIN_SIZE = 1024
+PRECOMPRESS_DIGESTS = 'precompressed.json'
+
+ICON_STYLES = {
+    'fas': 'solid', 'fa-solid': 'solid',
+    'far': 'regular', 'fa-regular': 'regular',
+    'fab': 'brands', 'fa-brands': 'brands',
+}
+# Sizing, animation and layout classes, which are not icon names
+ICON_MODIFIER = re.compile(
+    r'fa-(?:fw|li|ul|border|inverse|width-auto|\d*x|2?xs|sm|lg|2?xl|spin(?:-pulse|-reverse)?|pulse|'
+    r'beat(?:-fade)?|bounce|fade|shake|flip(?:-horizontal|-vertical|-both)?|rotate-(?:90|180|270|by)|'
+    r'pull-(?:left|right|start|end)|stack(?:-1x|-2x)?)'
+)
+
+
+def bundles():
+    return getattr(settings, 'STATIC_BUNDLES', {})
+
+
+def minify_css(source):
+    out = []
+    for token in CSS_TOKENS.findall(source):
+        if token.startswith('/*'):
+            # Keep /*! license */ comments
+            if token.startswith('/*!'):
+                out.append(token)
+            continue
+        if token.isspace():
+            if out and out[-1][-1:] not in CSS_PUNCTUATION + ':(':
+                out.append(' ')
+            continue
+        if token[0] in CSS_PUNCTUATION + ')' and out and out[-1] == ' ':
+            out.pop()
+        if token[0] == '}' and out and out[-1].endswith(';'):
+            out[-1] = out[-1][:-1]
+        out.append(token)
+    return ''.join(out).strip()
+
+
+def minify_js(source):
+    """Drop indentation, blank lines and whole-line ``//`` comments.
+
+    Line breaks are kept so automatic semicolon insertion is unaffected,
+    and lines inside template literals are left untouched.
+    """
+    lines = []
+    in_template = False
+    for line in source.splitlines():
+        if in_template:
+            lines.append(line)
+        else:
+            stripped = line.strip()
+            if stripped and not stripped.startswith('//'):
+                lines.append(stripped)
+        if line.count('`') % 2:
+            in_template = not in_template
+    return '\n'.join(lines) + '\n'
+
+
+def rebase_css_urls(source, source_path, bundle_path=None):
+    """Rewrite relative url()s so they still resolve from ``bundle_path``.
+
+    Without ``bundle_path``, ``source_path`` is the stylesheet's URL and
+    the url()s become absolute, for CSS inlined into a page.
+    """
+    source_dir = posixpath.dirname(source_path)
+    bundle_dir = posixpath.dirname(bundle_path or '')
+
+    def rebase(match):
+        quote, url = match.groups()
+        # %23 is an encoded '#': a fragment reference inside a data: URI
+        if re.match(r'^(?:[a-z]+:|/|#|%23)', url):
+            return match.group(0)
+        if bundle_path is None:
+            return f'url({quote}{urljoin(source_path, url)}{quote})'
+        target = posixpath.normpath(posixpath.join(source_dir, url))
+        return f'url({quote}{posixpath.relpath(target, bundle_dir or ".")}{quote})'
+
+    return CSS_URL.sub(rebase, source)
+
+
+def build_bundle(bundle_path, read):
+    """Concatenate the sources of ``bundle_path``; ``read(path)`` returns a source's text."""
+    parts = []
+    for path in bundles()[bundle_path]:
+        text = read(path)
+        if bundle_path.endswith('.css'):
+            text = rebase_css_urls(text, path, bundle_path)
+        else:
+            # Guard against a source that ends without a semicolon
+            text = text.rstrip() + '\n;'
+        parts.append(text)
+    return '\n'.join(parts)
+
+
+def minify(path, source):
+    if path.endswith('.css'):
+        return minify_css(source)
+    if path.endswith('.js'):
+        return minify_js(source)
+    return source
+
+
+def _encoders():
+    encoders = {'.gz': lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoders['.br'] = lambda data: brotli.compress(data, quality=11)
+    return encoders
+
+
+def precompress(root):
+    """Write ``.gz`` (and, with the brotli package, ``.br``) siblings under ``root``.
+
+    The source digests are kept in ``root/precompressed.json`` so only files
+    whose content changed since the last run are compressed again. A sibling
+    that would not be smaller than its source is removed instead of written.
+    Returns the number of files compressed.
+    """
+    root = Path(root)
+    encoders = _encoders()
+    digests_path = root / PRECOMPRESS_DIGESTS
+    try:
+        previous = json.loads(digests_path.read_text())
+    except (OSError, ValueError):
+        previous = {}
+    if previous.get('encodings') != sorted(encoders):
+        previous = {}
+    known = previous.get('files', {})
+
+    digests, compressed = {}, 0
+    for path in sorted(root.rglob('*')):
+        if path.suffix not in PRECOMPRESS_EXTENSIONS or path.name == PRECOMPRESS_DIGESTS or not path.is_file():
+            continue
+        data = path.read_bytes()
+        if len(data) < PRECOMPRESS_MIN_SIZE:
+            continue
+        name = path.relative_to(root).as_posix()
+        digests[name] = hashlib.sha256(data).hexdigest()
+        if known.get(name) == digests[name]:
+            continue
+        for suffix, encode in encoders.items():
+            sibling = path.with_name(path.name + suffix)
+            output = encode(data)
+            if len(output) < len(data):
+                sibling.write_bytes(output)
+            else:
+                sibling.unlink(missing_ok=True)
+        compressed += 1
+
+    digests_path.write_text(json.dumps({'encodings': sorted(encoders), 'files': digests}, indent=2) + '\n')
+    return compressed
+
+
+def parse_icon(classes):
+    """Return ``(style, name)`` for a class string like ``"fas fa-fw fa-star"``, or None."""
+    style, name = 'solid', None
+    for cls in classes.split():
+        if cls in ICON_STYLES:
+            style = ICON_STYLES[cls]
+        elif name is None and cls.startswith('fa-') and not ICON_MODIFIER.fullmatch(cls):
+            name = cls[3:]
+    return (style, name) if name else None
+
+
+@lru_cache(maxsize=None)
+def vendored_manifest():
+    """The vendor_assets manifest, or None when the assets have not been vendored."""
+    name = 'vendor/manifest.json'
+    try:
+        if staticfiles_storage.exists(name):
+            with staticfiles_storage.open(name) as fh:
+                return json.load(fh)
+        path = finders.find(name)
+        if path:
+            with open(path) as fh:
+                return json.load(fh)
+    except (OSError, ValueError):
+        pass
+    return None
@@ -0,0 +1,38 @@
+"""Helpers shared by the benchmark and build commands.
+
+``page_routes()`` lists every page route with a concrete path, and
+``percentile()`` summarises timings.
+"""
+from django.urls import reverse
+
+from . import urls as page_urls
+from .models import GalleryEvent
+
+# Slug routes whose view has no ``model``: the model the slug belongs to
+SLUG_MODELS = {
+    'gallery-photos': GalleryEvent,
+}
+
+
+def page_routes():
+    """Yield ``(name, path)`` for every route, using the first object for slug routes.
+
+    The slug's model is the view's ``model`` or the route's SLUG_MODELS
+    entry; slug routes with neither, or with no rows, are skipped.
+    """
+    for pattern in page_urls.urlpatterns:
+        name = f'{page_urls.app_name}:{pattern.name}'
+        if 'slug' in pattern.pattern.converters:
+            model = getattr(pattern.callback.view_class, 'model', None) or SLUG_MODELS.get(pattern.name)
+            obj = model.objects.order_by('pk').first() if model else None
+            if obj is None:
+                continue
+            yield pattern.name, reverse(name, kwargs={'slug': obj.slug})
+        else:
+            yield pattern.name, reverse(name)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
@@ -0,0 +1,132 @@
+"""Cached context and full-page responses for public pages.
+
+Values are stored per active language and dropped by the model signals
+registered in ``signals.py`` whenever the underlying content changes.
+"""
+import hashlib
+from collections import defaultdict
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import get_language
+
+from .middleware import note_cache_lookup
+from .models import SuccessStory, Partner, Program, Statistic, News, Document
+
+CACHE_TIMEOUT = getattr(settings, 'PAGES_CACHE_TIMEOUT', 60 * 60)
+
+HOMEPAGE_MODELS = (SuccessStory, Partner, Program, Statistic, News)
+
+HOMEPAGE_KEY = 'pages:index:{lang}'
+DOCUMENTS_KEY = 'pages:documents:{lang}'
+PAGE_KEY = 'pages:page:{digest}'
+VERSION_KEY = 'pages:version:{label}'
+
+
+def _language_keys(template):
+    return [template.format(lang=code) for code, _ in settings.LANGUAGES]
+
+
+def get_homepage_context():
+    """Return the IndexView context, building and caching it on a miss."""
+    key = HOMEPAGE_KEY.format(lang=get_language())
+    context = cache.get(key)
+    note_cache_lookup(context is not None)
+    if context is None:
+        context = {
+            'featured_stories': list(SuccessStory.objects.for_listing().filter(is_featured=True)),
+            'all_stories': list(SuccessStory.objects.for_listing()),
+            'partners': list(Partner.objects.filter(is_active=True)),
+            'programs': list(Program.objects.for_listing()),
+            'stats': {s.key: s for s in Statistic.objects.all()},
+            'latest_news': list(News.objects.for_listing()[:5]),
+        }
+        cache.set(key, context, CACHE_TIMEOUT)
+    return context
+
+
+def invalidate_homepage():
+    cache.delete_many(_language_keys(HOMEPAGE_KEY))
+
+
+def get_document_listings():
+    """Return ``{category: [documents]}`` for every Document category.
+
+    All categories come from one query on the (category, -order) index, so
+    the transparency pages share a single cached value per language.
+    """
+    key = DOCUMENTS_KEY.format(lang=get_language())
+    listings = cache.get(key)
+    note_cache_lookup(listings is not None)
+    if listings is None:
+        listings = defaultdict(list)
+        for document in Document.objects.order_by('category', '-order'):
+            listings[document.category].append(document)
+        listings = {category: listings[category] for category, _ in Document.CATEGORY_CHOICES}
+        cache.set(key, listings, CACHE_TIMEOUT)
+    return listings
+
+
+def invalidate_documents():
+    cache.delete_many(_language_keys(DOCUMENTS_KEY))
+
+
+def _model_versions(models):
+    """Return the current version token of each model, creating missing ones."""
+    keys = [VERSION_KEY.format(label=model._meta.label_lower) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, uuid4().hex, None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_model_version(model):
+    """Invalidate every cached page that depends on ``model``."""
+    cache.set(VERSION_KEY.format(label=model._meta.label_lower), uuid4().hex, None)
+
+
+def page_cache_key(request, models, params=()):
+    """Key a page on path, language, auth state and its models' versions.
+
+    Of the query string only ``params``, the ones the view reads, count.
+    """
+    parts = [
+        request.path,
+        *(f'{param}={request.GET.get(param, "")}' for param in params),
+        get_language(),
+        'auth' if request.user.is_authenticated else 'anon',
+        *_model_versions(models),
+    ]
+    digest = hashlib.md5('|'.join(parts).encode()).hexdigest()
+    return PAGE_KEY.format(digest=digest)
+
+
+def get_cached_page(key):
+    response = cache.get(key)
+    note_cache_lookup(response is not None)
+    return response
+
+
+def store_page(request, key, response):
+    """Cache a rendered response unless it is user- or token-specific."""
+    if request.method != 'GET' or response.status_code != 200:
+        return
+    if response.cookies or request.META.get('CSRF_COOKIE_NEEDS_UPDATE'):
+        return
+    cache.set(key, response, CACHE_TIMEOUT)
+
+
+def invalidate_model(model):
+    """Drop every cached value built from ``model``.
+
+    Called from the save/delete signals, and explicitly after bulk writes
+    that bypass them.
+    """
+    if model in HOMEPAGE_MODELS:
+        invalidate_homepage()
+    if model is Document:
+        invalidate_documents()
+    bump_model_version(model)
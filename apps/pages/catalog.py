@@ -0,0 +1,42 @@
+"""Interface strings for the static parts of the templates.
+
+The strings live in ``static/js/translations/<lang>.json`` (kept out of
+collectstatic, see config/apps.py) as nested
+objects addressed by dotted keys (``nav.home``). They are loaded once per
+process and looked up for the active language, falling back to the
+default language when a translation is missing.
+"""
+import json
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils.translation import get_language
+
+CATALOG_DIR = settings.BASE_DIR / 'static' / 'js' / 'translations'
+
+
+@lru_cache(maxsize=None)
+def load_catalog(lang):
+    try:
+        with open(CATALOG_DIR / f'{lang}.json', encoding='utf-8') as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return {}
+
+
+def _lookup(catalog, key):
+    value = catalog
+    for part in key.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value if isinstance(value, str) else None
+
+
+def translate(key, lang=None):
+    """Return the string for ``key`` in ``lang`` (default: active language), or ''."""
+    lang = (lang or get_language() or settings.LANGUAGE_CODE).split('-')[0]
+    value = _lookup(load_catalog(lang), key)
+    if value is None and lang != settings.LANGUAGE_CODE:
+        value = _lookup(load_catalog(settings.LANGUAGE_CODE), key)
+    return value or ''
@@ -0,0 +1,48 @@
+"""Stored child counts (GalleryEvent.photo_count, News.image_count).
+
+The counts are recomputed from the child table instead of incremented, so
+a photo moved between events or a missed signal cannot leave them off by
+one for good. ``recount()`` repairs any drift left by bulk operations.
+"""
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .models import GalleryPhoto, NewsImage
+
+# child model -> (foreign key to the parent, counter field on the parent)
+COUNTERS = {
+    GalleryPhoto: ('event', 'photo_count'),
+    NewsImage: ('news', 'image_count'),
+}
+
+
+def _count_subquery(child_model, fk):
+    counts = (
+        child_model.objects.filter(**{fk: OuterRef('pk')})
+        .order_by().values(fk).annotate(n=Count('pk')).values('n')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def refresh_counts(child_model, parent_ids):
+    """Recompute the counter of the given parents of ``child_model``."""
+    fk, field = COUNTERS[child_model]
+    parent_ids = {pk for pk in parent_ids if pk is not None}
+    if not parent_ids:
+        return
+    parent_model = child_model._meta.get_field(fk).related_model
+    parent_model.objects.filter(pk__in=parent_ids).update(**{field: _count_subquery(child_model, fk)})
+
+
+def recount():
+    """Fix every drifted counter; returns ``{parent model: rows fixed}``."""
+    fixed = {}
+    for child_model, (fk, field) in COUNTERS.items():
+        parent_model = child_model._meta.get_field(fk).related_model
+        drifted = list(
+            parent_model.objects.annotate(actual=_count_subquery(child_model, fk))
+            .exclude(**{field: F('actual')}).values_list('pk', flat=True)
+        )
+        refresh_counts(child_model, drifted)
+        fixed[parent_model] = len(drifted)
+    return fixed
@@ -0,0 +1,155 @@
+"""Critical (above-the-fold) CSS per page.
+
+``build_critical_css`` renders every page, keeps the part a visitor sees
+first — the site header and the first block of <main> — and selects the
+CSS rules from the page's own stylesheets that match anything in it.
+The result is written to ``CRITICAL_CSS_DIR/<url name>.css``.
+
+The ``{% critical_css %}`` tag then inlines that file and switches the
+stylesheet links it wraps to non-blocking loading, the same
+``media="print"`` pattern used for the font stylesheets.
+"""
+import re
+from functools import lru_cache
+
+from bs4 import BeautifulSoup
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from soupsieve import SelectorSyntaxError
+
+from .assets import minify_css, rebase_css_urls
+
+# Pseudo-classes and pseudo-elements that depend on interaction or generate
+# content; stripped before matching so `.btn:hover` counts as `.btn`
+DYNAMIC_PSEUDO = re.compile(
+    r'::?(?:hover|focus|focus-within|focus-visible|active|visited|link|target|checked|disabled|'
+    r'before|after|placeholder|selection|marker|first-letter|first-line|backdrop|'
+    r'-webkit-[\w-]+|-moz-[\w-]+|-ms-[\w-]+)(?:\([^)]*\))?'
+)
+ANIMATION_NAME = re.compile(r'animation(?:-name)?\s*:([^;}]+)')
+STYLESHEET_LINK = re.compile(r'<link rel="stylesheet" href="([^"]+)">')
+
+
+def parse_css(css):
+    """Split minified CSS into ``(prelude, body)`` pairs.
+
+    ``body`` is the declaration string for plain rules and a nested list for
+    conditional group rules (@media, @supports).
+    """
+    rules, i = [], 0
+    while i < len(css):
+        start = css.find('{', i)
+        if start == -1:
+            break
+        prelude = css[i:start].strip()
+        if ';' in prelude and prelude.startswith('@'):
+            # Statement at-rules such as @import or @charset
+            prelude = prelude.rsplit(';', 1)[1].strip()
+        depth, j = 1, start + 1
+        while depth and j < len(css):
+            depth += {'{': 1, '}': -1}.get(css[j], 0)
+            j += 1
+        body = css[start + 1:j - 1]
+        if prelude.startswith(('@media', '@supports')):
+            rules.append((prelude, parse_css(body)))
+        else:
+            rules.append((prelude, body))
+        i = j
+    return rules
+
+
+def _matches(fold, selectors):
+    for selector in selectors.split(','):
+        selector = DYNAMIC_PSEUDO.sub('', selector).strip() or '*'
+        try:
+            if fold.select_one(selector) is not None:
+                return True
+        except (SelectorSyntaxError, NotImplementedError):
+            # Keep rules the matcher cannot evaluate rather than risk a flash
+            return True
+    return False
+
+
+def _select(rules, fold, keyframes):
+    out = []
+    for prelude, body in rules:
+        if isinstance(body, list):
+            inner = _select(body, fold, keyframes)
+            if inner:
+                out.append(f'{prelude}{{{inner}}}')
+        elif prelude.startswith('@font-face'):
+            out.append(f'{prelude}{{{body}}}')
+        elif prelude.startswith('@keyframes'):
+            keyframes[prelude.split(None, 1)[1]] = f'{prelude}{{{body}}}'
+        elif not prelude.startswith('@') and _matches(fold, prelude):
+            out.append(f'{prelude}{{{body}}}')
+    return ''.join(out)
+
+
+def above_the_fold(html):
+    """Return the page with everything below the first block of <main> removed."""
+    soup = BeautifulSoup(html, 'html.parser')
+    for tag in soup.find_all(['script', 'footer', 'noscript']):
+        tag.decompose()
+    main = soup.find('main')
+    if main:
+        blocks = main.find_all(recursive=False)
+        for block in blocks[1:]:
+            block.decompose()
+    return soup
+
+
+def stylesheet_urls(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    # dict.fromkeys: a deferred link appears twice (link and <noscript>)
+    return list(dict.fromkeys(
+        link['href'] for link in soup.find_all('link', rel='stylesheet')
+        if link.get('href', '').startswith(settings.STATIC_URL)
+    ))
+
+
+def read_static(url):
+    path = url[len(settings.STATIC_URL):].split('?')[0]
+    if staticfiles_storage.exists(path):
+        with staticfiles_storage.open(path) as fh:
+            return fh.read().decode('utf-8')
+    found = finders.find(path)
+    if not found:
+        raise FileNotFoundError(path)
+    with open(found, encoding='utf-8') as fh:
+        return fh.read()
+
+
+def extract_critical(html):
+    """Return the minified CSS needed to render the first screen of ``html``."""
+    fold = above_the_fold(html)
+    keyframes = {}
+    parts = [
+        # Relative url()s would resolve against the page once inlined
+        _select(parse_css(minify_css(rebase_css_urls(read_static(url), url))), fold, keyframes)
+        for url in stylesheet_urls(html)
+    ]
+    css = ''.join(parts)
+    used = {name.strip() for match in ANIMATION_NAME.findall(css) for name in re.split(r'[\s,]+', match)}
+    css += ''.join(rule for name, rule in keyframes.items() if name in used)
+    return css
+
+
+@lru_cache(maxsize=None)
+def load_critical_css(name):
+    try:
+        return (settings.CRITICAL_CSS_DIR / f'{name}.css').read_text(encoding='utf-8')
+    except OSError:
+        return ''
+
+
+def defer_stylesheets(html):
+    """Load the <link rel="stylesheet"> tags in ``html`` without blocking rendering."""
+    return STYLESHEET_LINK.sub(
+        lambda m: (
+            f'<link rel="stylesheet" href="{m[1]}" media="print" onload="this.media=\'all\'">'
+            f'<noscript><link rel="stylesheet" href="{m[1]}"></noscript>'
+        ),
+        html,
+    )
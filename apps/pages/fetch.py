@@ -0,0 +1,150 @@
+"""Concurrent HTTP fetching for the import commands.
+
+A single pooled ``requests.Session`` is shared by a bounded thread pool.
+Requests to the same host are spaced out by a per-host rate limit, and
+failed or throttled responses are retried with exponential backoff. An
+optional on-disk cache turns repeat downloads into conditional requests.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+
+def write_atomic(path, data):
+    """Write ``data`` (bytes) to ``path`` without leaving a partial file behind."""
+    tmp = f'{path}.{threading.get_ident()}.tmp'
+    with open(tmp, 'wb') as fh:
+        fh.write(data)
+    os.replace(tmp, path)
+
+
+class HttpCache:
+    """On-disk response bodies keyed by URL, with their ETag/Last-Modified."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode()).hexdigest()
+        return self.directory / f'{key}.json', self.directory / f'{key}.body'
+
+    def load(self, url):
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text())
+            return meta, body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+    def store(self, url, response):
+        meta = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_type': response.headers.get('Content-Type', ''),
+            'encoding': response.encoding,
+        }
+        if not (meta['etag'] or meta['last_modified']):
+            return
+        meta_path, body_path = self._paths(url)
+        write_atomic(body_path, response.content)
+        write_atomic(meta_path, json.dumps(meta).encode())
+
+    @staticmethod
+    def conditional_headers(meta):
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    @staticmethod
+    def build_response(url, meta, body):
+        """A 200 response equivalent to the cached one."""
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict({'Content-Type': meta['content_type']})
+        response.encoding = meta['encoding']
+        response._content = body
+        response.from_cache = True
+        return response
+
+
+class HostRateLimiter:
+    """Allow at most ``rate`` requests per second to each host."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        if not self.interval:
+            return
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class Fetcher:
+    def __init__(self, workers=8, rate=5.0, retries=3, backoff=0.5, timeout=30, headers=None, cache=None):
+        self.workers = workers
+        self.timeout = timeout
+        self.cache = cache
+        self.cache_hits = 0
+        self._hits_lock = threading.Lock()
+        self.limiter = HostRateLimiter(rate)
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=('GET', 'HEAD'),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=workers, pool_maxsize=workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get(self, url, **kwargs):
+        self.limiter.wait(url)
+        kwargs.setdefault('timeout', self.timeout)
+        cached = self.cache.load(url) if self.cache else None
+        if cached:
+            kwargs['headers'] = {**kwargs.get('headers', {}), **HttpCache.conditional_headers(cached[0])}
+
+        response = self.session.get(url, **kwargs)
+        if cached and response.status_code == 304:
+            with self._hits_lock:
+                self.cache_hits += 1
+            return HttpCache.build_response(url, *cached)
+        if self.cache and response.status_code == 200:
+            self.cache.store(url, response)
+        return response
+
+    def map(self, func, items):
+        """Run ``func`` over ``items`` on the worker pool, preserving order."""
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(func, items))
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,199 @@
+"""Optimised originals and resized WebP/AVIF derivatives of uploaded images.
+
+Derivatives are written next to the original, e.g. ``news/foo.jpg`` gets
+``news/foo-jpg-480w.webp`` and ``news/foo-jpg-480w.avif`` for every
+breakpoint narrower than the original, plus one at the original's own width
+as the largest candidate.
+"""
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, features
+
+from .models import SuccessStory, Partner, GalleryEvent, GalleryPhoto, News, NewsImage
+
+BREAKPOINTS = (480, 800, 1200, 1920)
+
+FORMATS = [fmt for fmt in ('avif', 'webp') if features.check(fmt)]
+
+QUALITY = {'avif': 55, 'webp': 80}
+
+# Originals are capped to this many pixels on the long edge
+MAX_DIMENSION = 2560
+
+REENCODE_OPTIONS = {
+    'JPEG': {'quality': 85, 'optimize': True, 'progressive': True},
+    'PNG': {'optimize': True},
+    'WEBP': {'quality': 85, 'method': 6},
+}
+
+IMAGE_FIELDS = {
+    SuccessStory: ('image',),
+    Partner: ('logo',),
+    GalleryEvent: ('cover_image',),
+    GalleryPhoto: ('image',),
+    News: ('image',),
+    NewsImage: ('image',),
+}
+
+
+def derivative_name(name, width, fmt):
+    # Keep the extension, so foo.jpg and foo.png get distinct derivatives
+    root, ext = os.path.splitext(name)
+    if ext:
+        root = f'{root}-{ext[1:]}'
+    return f'{root}-{width}w.{fmt}'
+
+
+def derivative_widths(width):
+    """The breakpoints narrower than ``width``, then ``width`` itself."""
+    return [breakpoint for breakpoint in BREAKPOINTS if breakpoint < width] + [width]
+
+
+def dimension_fields(field_name):
+    """Names of the width and height fields stored next to image field ``field_name``."""
+    return f'{field_name}_width', f'{field_name}_height'
+
+
+def stored_width(fieldfile):
+    """The recorded width of ``fieldfile``, or None until its derivatives are built."""
+    if not fieldfile:
+        return None
+    return getattr(fieldfile.instance, dimension_fields(fieldfile.field.name)[0], None)
+
+
+def generate_derivatives(fieldfile):
+    """Write missing derivatives of ``fieldfile``.
+
+    Returns ``(created, (width, height))``: how many files were written and
+    the size of the image they were made from.
+    """
+    storage = fieldfile.storage
+    created = 0
+    with fieldfile.open('rb') as fh:
+        image = ImageOps.exif_transpose(Image.open(fh))
+        image.load()
+    if image.mode not in ('RGB', 'RGBA'):
+        has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+
+    for width in derivative_widths(image.width):
+        height = round(image.height * width / image.width)
+        resized = None
+        for fmt in FORMATS:
+            name = derivative_name(fieldfile.name, width, fmt)
+            if storage.exists(name):
+                continue
+            if resized is None:
+                resized = image.resize((width, height), Image.LANCZOS)
+            buf = BytesIO()
+            resized.save(buf, fmt.upper(), quality=QUALITY[fmt])
+            storage.save(name, ContentFile(buf.getvalue()))
+            created += 1
+    return created, image.size
+
+
+def _build_derivatives(instance, field_name):
+    """Build the derivatives of one image field, then record its size."""
+    fieldfile = getattr(instance, field_name)
+    if not fieldfile:
+        return 0
+    created, size = generate_derivatives(fieldfile)
+    dimensions = dict(zip(dimension_fields(field_name), size))
+    if any(getattr(instance, name) != value for name, value in dimensions.items()):
+        type(instance).objects.filter(pk=instance.pk).update(**dimensions)
+        for name, value in dimensions.items():
+            setattr(instance, name, value)
+    return created
+
+
+def optimize_original(fieldfile):
+    """Strip metadata from the original, apply its orientation and cap its size.
+
+    The file is only rewritten when it carried EXIF data, was oversized or
+    re-encoding saves at least 10%. Returns the storage name of the result.
+    """
+    with fieldfile.open('rb') as fh:
+        data = fh.read()
+    image = Image.open(BytesIO(data))
+    fmt = image.format
+    if fmt not in REENCODE_OPTIONS or getattr(image, 'is_animated', False):
+        return fieldfile.name
+
+    had_exif = bool(image.getexif())
+    oversized = max(image.size) > MAX_DIMENSION
+    icc_profile = image.info.get('icc_profile')
+    mode = image.mode
+    image = ImageOps.exif_transpose(image)
+    image.thumbnail((MAX_DIMENSION, MAX_DIMENSION), Image.LANCZOS)
+    if fmt == 'JPEG' and image.mode not in ('RGB', 'L'):
+        image = image.convert('RGB')
+
+    buf = BytesIO()
+    options = dict(REENCODE_OPTIONS[fmt])
+    # A profile describes the original colour space (e.g. CMYK), not the converted one
+    if icc_profile and image.mode == mode:
+        options['icc_profile'] = icc_profile
+    image.save(buf, fmt, **options)
+    if not (had_exif or oversized) and buf.tell() > len(data) * 0.9:
+        return fieldfile.name
+
+    storage = fieldfile.storage
+    content = ContentFile(buf.getvalue())
+    try:
+        original_path = storage.path(fieldfile.name)
+    except NotImplementedError:
+        # Storages without local paths: save under a new name before
+        # deleting the original; the caller records the new name
+        name = storage.save(fieldfile.name, content)
+        storage.delete(fieldfile.name)
+        return name
+
+    # Write next to the original and rename over it, so a failed write
+    # leaves the upload untouched and its URL never 404s
+    root, ext = os.path.splitext(fieldfile.name)
+    tmp_name = storage.save(f'{root}.tmp{ext}', content)
+    try:
+        os.replace(storage.path(tmp_name), original_path)
+    except OSError:
+        storage.delete(tmp_name)
+        raise
+    return fieldfile.name
+
+
+def process_instance_images(instance):
+    """Optimise every original of ``instance`` and build its derivatives."""
+    created = 0
+    for field_name in IMAGE_FIELDS.get(type(instance), ()):
+        fieldfile = getattr(instance, field_name)
+        if not fieldfile:
+            continue
+        name = optimize_original(fieldfile)
+        if name != fieldfile.name:
+            type(instance).objects.filter(pk=instance.pk).update(**{field_name: name})
+            fieldfile.name = name
+        created += _build_derivatives(instance, field_name)
+    return created
+
+
+def generate_instance_derivatives(instance):
+    created = 0
+    for field_name in IMAGE_FIELDS.get(type(instance), ()):
+        created += _build_derivatives(instance, field_name)
+    return created
+
+
+def available_derivatives(fieldfile, fmt):
+    """Return ``[(url, width)]`` for the derivatives of ``fieldfile``.
+
+    Read from the recorded width, so rendering neither opens the image nor
+    asks the storage; empty until the image has been processed.
+    """
+    original_width = stored_width(fieldfile)
+    if not original_width:
+        return []
+    return [
+        (fieldfile.storage.url(derivative_name(fieldfile.name, width, fmt)), width)
+        for width in derivative_widths(original_width)
+    ]
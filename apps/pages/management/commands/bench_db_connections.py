@@ -0,0 +1,102 @@
+"""
+Measure the per-request database overhead of each connection strategy.
+
+Usage:
+    DJANGO_SETTINGS_MODULE=config.settings.production \\
+        python manage.py bench_db_connections --requests 500
+
+Simulates the request cycle the way gunicorn drives it (request_started,
+one query, request_finished, which is where Django closes or recycles
+connections) against the configured PostgreSQL database, once for each
+strategy:
+
+  - new connection per request (CONN_MAX_AGE=0, the old default);
+  - persistent connection (CONN_MAX_AGE=60);
+  - persistent connection with CONN_HEALTH_CHECKS;
+  - psycopg 3 pool (skipped when psycopg 3 or psycopg_pool is missing).
+
+Reports p50/p95 latency per request and the time saved against the first.
+"""
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.signals import request_finished, request_started
+from django.db import connection
+
+from apps.pages.benchmarking import percentile
+
+STRATEGIES = {
+    'new connection per request': {'CONN_MAX_AGE': 0, 'CONN_HEALTH_CHECKS': False},
+    'persistent': {'CONN_MAX_AGE': 60, 'CONN_HEALTH_CHECKS': False},
+    'persistent + health checks': {'CONN_MAX_AGE': 60, 'CONN_HEALTH_CHECKS': True},
+    'pool': {'CONN_MAX_AGE': 0, 'CONN_HEALTH_CHECKS': False, 'pool': {'min_size': 1, 'max_size': 2}},
+}
+
+
+def pool_available():
+    try:
+        import psycopg_pool  # noqa: F401
+        from django.db.backends.postgresql.psycopg_any import is_psycopg3
+    except ImportError:
+        return False
+    return is_psycopg3
+
+
+class Command(BaseCommand):
+    help = 'Benchmark per-request connection overhead of each PostgreSQL connection strategy'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='Simulated requests per strategy')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('Run this against PostgreSQL (config.settings.production)')
+
+        original = dict(connection.settings_dict)
+        original_options = dict(original.get('OPTIONS', {}))
+        results = {}
+        try:
+            for name, strategy in STRATEGIES.items():
+                if 'pool' in strategy and not pool_available():
+                    self.stdout.write(self.style.WARNING(f'Skipping "{name}": needs psycopg 3 and psycopg_pool'))
+                    continue
+                self._configure(strategy, original_options)
+                results[name] = self._run(options['requests'])
+        finally:
+            self._reset()
+            connection.settings_dict.update(original)
+            connection.settings_dict['OPTIONS'] = original_options
+
+        baseline = statistics.median(next(iter(results.values())))
+        self.stdout.write(f'\n{"strategy":<30}{"p50 ms":>10}{"p95 ms":>10}{"saved ms":>10}')
+        for name, timings in results.items():
+            p50 = statistics.median(timings)
+            self.stdout.write(
+                f'{name:<30}{p50:>10.2f}{percentile(timings, 95):>10.2f}{baseline - p50:>10.2f}'
+            )
+
+    def _reset(self):
+        connection.close()
+        connection.close_pool()
+
+    def _configure(self, strategy, original_options):
+        self._reset()
+        connection.settings_dict['CONN_MAX_AGE'] = strategy['CONN_MAX_AGE']
+        connection.settings_dict['CONN_HEALTH_CHECKS'] = strategy['CONN_HEALTH_CHECKS']
+        options = {k: v for k, v in original_options.items() if k != 'pool'}
+        if 'pool' in strategy:
+            options['pool'] = strategy['pool']
+        connection.settings_dict['OPTIONS'] = options
+
+    def _run(self, requests):
+        timings = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            request_started.send(sender=self.__class__)
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+                cursor.fetchone()
+            request_finished.send(sender=self.__class__)
+            timings.append((time.perf_counter() - start) * 1000)
+        return timings
@@ -0,0 +1,147 @@
+"""
+Benchmark render latency, SQL query count and response size of every page.
+
+Usage:
+    python manage.py bench_pages --size 500 --iterations 20 --output bench.json
+    python manage.py bench_pages --compare bench.json
+    python manage.py bench_pages --check-queries   # fail on N+1 or slow queries
+
+Runs against a throwaway test database seeded by apps.pages.seeding with
+``--size`` rows per listing model, requests every route in
+apps/pages/urls.py once per language through the Django test client and
+reports p50/p95 render time, queries and bytes. Caches are cleared before each request unless --warm
+is given. Results are written as JSON so runs can be compared between
+commits. With --check-queries every request also runs under
+apps.pages.querycheck.QueryInspector and the command fails if any route
+repeats a query or runs a slow one, so it can gate CI.
+"""
+import json
+import statistics
+import subprocess
+import time
+from contextlib import nullcontext
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings, setup_test_environment
+from django.utils import timezone
+
+from apps.pages.benchmarking import page_routes, percentile
+from apps.pages.querycheck import QueryInspector
+from apps.pages.seeding import ContentSeeder
+
+BENCH_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'bench_pages',
+    }
+}
+
+
+class Command(BaseCommand):
+    help = 'Benchmark page render time, query count and response size'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, default=100, help='Rows per listing model in the seeded dataset')
+        parser.add_argument('--iterations', type=int, default=10, help='Requests per route and language')
+        parser.add_argument('--warm', action='store_true', help='Keep caches between requests')
+        parser.add_argument('--output', default='bench_results.json', help='Where to write the JSON results')
+        parser.add_argument('--compare', help='Previous results file to diff against')
+        parser.add_argument('--check-queries', action='store_true',
+                            help='Fail if a route runs repeated (N+1) or slow queries')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            # A private cache, so clearing it between requests (and the
+            # invalidation done by seeding) leaves the site's cache alone
+            with override_settings(ALLOWED_HOSTS=['testserver'], DEBUG=False, CACHES=BENCH_CACHES):
+                self._seed(options['size'])
+                results = self._run(options['iterations'], options['warm'], options['check_queries'])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        report = {
+            'commit': self._git_commit(),
+            'created_at': timezone.now().isoformat(),
+            'size': options['size'],
+            'iterations': options['iterations'],
+            'warm': options['warm'],
+            'results': results,
+        }
+        with open(options['output'], 'w') as fh:
+            json.dump(report, fh, indent=2)
+
+        previous = {}
+        if options['compare']:
+            with open(options['compare']) as fh:
+                previous = {(r['route'], r['lang']): r for r in json.load(fh)['results']}
+        self._print(results, previous)
+        self.stdout.write(self.style.SUCCESS(f'\nResults written to {options["output"]}'))
+
+        problems = sum(r.get('query_problems', 0) for r in results)
+        if problems:
+            raise CommandError(f'{problems} query problem(s) found, see the warnings above')
+
+    def _seed(self, size):
+        self.stdout.write(f'Seeding {size} rows per listing model...')
+        seeder = ContentSeeder()
+        seeder.news(size, images_per_news=3)
+        seeder.gallery(size, photos_per_event=10)
+        seeder.documents(size)
+        seeder.supporting(min(size, 20))
+
+    def _run(self, iterations, warm, check_queries):
+        client = Client()
+        results = []
+        for route, path in page_routes():
+            for lang, _ in settings.LANGUAGES:
+                timings, queries, size, problems = [], [], 0, 0
+                for i in range(iterations):
+                    if not warm:
+                        cache.clear()
+                    # The first (cold) request of each route is enough to spot query problems
+                    inspect = check_queries and i == 0
+                    inspector = QueryInspector(f'{path} [{lang}]') if inspect else nullcontext()
+                    with CaptureQueriesContext(connection) as captured, inspector:
+                        start = time.perf_counter()
+                        response = client.get(path, HTTP_ACCEPT_LANGUAGE=lang)
+                        timings.append((time.perf_counter() - start) * 1000)
+                    queries.append(len(captured))
+                    size = len(response.content)
+                    if inspect:
+                        problems = len(inspector.found)
+                results.append({
+                    'route': route,
+                    'path': path,
+                    'lang': lang,
+                    'status': response.status_code,
+                    'p50_ms': round(statistics.median(timings), 2),
+                    'p95_ms': round(percentile(timings, 95), 2),
+                    'queries': max(queries),
+                    'bytes': size,
+                    **({'query_problems': problems} if problems else {}),
+                })
+        return results
+
+    def _print(self, results, previous):
+        self.stdout.write(f'\n{"route":<22}{"lang":<6}{"p50 ms":>10}{"p95 ms":>10}{"queries":>9}{"bytes":>10}')
+        for r in results:
+            line = f'{r["route"]:<22}{r["lang"]:<6}{r["p50_ms"]:>10}{r["p95_ms"]:>10}{r["queries"]:>9}{r["bytes"]:>10}'
+            old = previous.get((r['route'], r['lang']))
+            if old:
+                line += f'   Δp50 {r["p50_ms"] - old["p50_ms"]:+.2f} ms, Δqueries {r["queries"] - old["queries"]:+d}'
+            self.stdout.write(line)
+
+    def _git_commit(self):
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'],
+                cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ''
@@ -0,0 +1,48 @@
+"""
+Extract the above-the-fold CSS of every page.
+
+Usage:
+    python manage.py build_critical_css
+
+Renders each route in apps/pages/urls.py (detail routes with their first
+object) and writes the CSS rules that the header and the first block of
+<main> need to CRITICAL_CSS_DIR/<url name>.css. Base templates inline it
+with {% critical_css %}. Run it after collectstatic so the rules are read
+from the built stylesheets, and restart the app server to pick up the
+new files.
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings
+
+from apps.pages.benchmarking import page_routes
+from apps.pages.critical import extract_critical, load_critical_css
+
+
+class Command(BaseCommand):
+    help = 'Build the per-page critical CSS files'
+
+    def handle(self, *args, **options):
+        output_dir = settings.CRITICAL_CSS_DIR
+        output_dir.mkdir(parents=True, exist_ok=True)
+        client = Client(HTTP_ACCEPT_LANGUAGE=settings.LANGUAGE_CODE)
+        written, failed = 0, 0
+        with override_settings(ALLOWED_HOSTS=['testserver'], PAGES_FULL_PAGE_CACHE=False):
+            for name, path in page_routes():
+                # secure=True: production settings redirect plain HTTP to HTTPS
+                response = client.get(path, secure=True)
+                if response.status_code != 200:
+                    self.stdout.write(self.style.WARNING(f'  {name:<22}HTTP {response.status_code} for {path}'))
+                    failed += 1
+                    continue
+                if not response['Content-Type'].startswith('text/html'):
+                    continue
+                css = extract_critical(response.content.decode())
+                (output_dir / f'{name}.css').write_text(css, encoding='utf-8')
+                self.stdout.write(f'  {name:<22}{len(css):>8} bytes')
+                written += 1
+        load_critical_css.cache_clear()
+        if failed:
+            raise CommandError(f'{failed} route(s) did not render; wrote {written} files to {output_dir}.')
+        self.stdout.write(self.style.SUCCESS(f'Done! Wrote {written} files to {output_dir}.'))
@@ -0,0 +1,35 @@
+"""
+Generate resized WebP/AVIF derivatives for images that are already uploaded.
+
+Usage:
+    python manage.py build_image_derivatives
+
+New uploads get their derivatives on save; this command backfills existing
+records and the image sizes the srcsets are built from. Derivatives that
+already exist are left untouched.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.pages.cache import invalidate_model
+from apps.pages.images import IMAGE_FIELDS, generate_instance_derivatives
+
+
+class Command(BaseCommand):
+    help = 'Generate responsive image derivatives for all uploaded images'
+
+    def handle(self, *args, **options):
+        total = 0
+        for model in IMAGE_FIELDS:
+            self.stdout.write(f'Processing {model._meta.verbose_name_plural}...')
+            for obj in model.objects.all().iterator():
+                try:
+                    created = generate_instance_derivatives(obj)
+                except (OSError, ValueError) as e:
+                    self.stdout.write(self.style.WARNING(f'  {model.__name__} #{obj.pk}: {e}'))
+                    continue
+                if created:
+                    self.stdout.write(f'  {model.__name__} #{obj.pk}: {created} derivatives')
+                total += created
+            # Sizes are written with update(), which sends no signals
+            invalidate_model(model)
+        self.stdout.write(self.style.SUCCESS(f'Done! Created {total} derivatives.'))
@@ -1,19 +1,28 @@
 """
 Import news articles from startup.chisinau.md/noutati/
 Fetches all pages, downloads images, creates News records.
+
+List pages, articles and images are downloaded concurrently through a pooled
+session with per-host rate limiting and retries (see apps.pages.fetch).
+
+Runs are incremental: responses are revalidated with ETag/Last-Modified
+against an on-disk cache, the crawl stops at the newest article seen by the
+previous run (the high-water mark), and a checkpoint file lets an
+interrupted run resume with the articles it had not imported yet.
 """
-import os
+import json
 import re
 from datetime import datetime
-from io import BytesIO
+from pathlib import Path
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
+from django.conf import settings
 from django.core.files.base import ContentFile
 from django.core.management.base import BaseCommand
 from django.utils.text import slugify
 
+from apps.pages.fetch import Fetcher, HttpCache, write_atomic
 from apps.pages.models import News
 
 HEADERS = {
@@ -21,130 +30,229 @@ HEADERS = {
     'Accept-Encoding': 'gzip, deflate',
 }
 BASE_URL = 'https://startup.chisinau.md'
-NEWS_URL = f'{BASE_URL}/category/comunicate-de-presa/'
 
 
 class Command(BaseCommand):
     help = 'Import news from startup.chisinau.md/noutati/'
 
-    def handle(self, *args, **options):
-        articles = []
-
-        # Collect article links from all pages
-        for page_num in range(1, 10):
-            url = NEWS_URL if page_num == 1 else f'{NEWS_URL}page/{page_num}/'
-            self.stdout.write(f'Fetching list page {page_num}: {url}')
-
-            try:
-                resp = requests.get(url, headers=HEADERS, timeout=30)
-            except Exception as e:
-                self.stdout.write(f'  Page {page_num} fetch error: {e}, stopping.')
-                break
-            if resp.status_code != 200:
-                self.stdout.write(f'  Page {page_num} returned {resp.status_code}, stopping.')
-                break
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=8, help='Concurrent HTTP requests')
+        parser.add_argument('--rate', type=float, default=5.0, help='Max requests per second per host')
+        parser.add_argument('--base-url', default=BASE_URL, help='Site to import from (e.g. a local mirror)')
+        parser.add_argument('--full', action='store_true',
+                            help='Scan every list page instead of stopping at already imported articles')
+        parser.add_argument('--restart', action='store_true', help='Discard the checkpoint of an interrupted run')
 
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            items = soup.select('.blog-posts .item')
-            if not items:
-                # Try alternative selectors
-                items = soup.select('article') or soup.select('.post')
-            if not items:
-                self.stdout.write(f'  No articles found on page {page_num}, stopping.')
-                break
-
-            for item in items:
-                link_tag = item.find('a', href=True)
-                if not link_tag:
-                    continue
-                article_url = link_tag['href']
-                if not article_url.startswith('http'):
-                    article_url = urljoin(BASE_URL, article_url)
-
-                # Get thumbnail image
-                img_tag = item.find('img')
-                thumb_url = ''
-                if img_tag:
-                    thumb_url = img_tag.get('src', '') or img_tag.get('data-src', '')
-
-                # Get date from the card
-                date_el = item.select_one('.date')
-                date_text = ''
-                if date_el:
-                    date_text = date_el.get_text(strip=True)
-
-                # Get title
-                title_el = item.find('h4') or item.find('h3') or item.find('h2')
-                title = title_el.get_text(strip=True) if title_el else ''
-
-                # Get excerpt
-                excerpt_el = item.find('p')
-                excerpt = excerpt_el.get_text(strip=True) if excerpt_el else ''
-
-                articles.append({
-                    'url': article_url,
-                    'thumb_url': thumb_url,
-                    'date_text': date_text,
-                    'title': title,
-                    'excerpt': excerpt,
-                })
-
-            self.stdout.write(f'  Found {len(items)} articles on page {page_num}')
+    def handle(self, *args, **options):
+        self.base_url = options['base_url'].rstrip('/')
+        news_url = f'{self.base_url}/category/comunicate-de-presa/'
+        state_dir = Path(settings.IMPORT_CACHE_DIR) / 'news'
+        self.state_path = state_dir / 'state.json'
+        self.fetcher = Fetcher(
+            workers=options['workers'],
+            rate=options['rate'],
+            headers=HEADERS,
+            cache=HttpCache(state_dir / 'http'),
+        )
+        try:
+            self._import(news_url, options['full'], options['restart'])
+        finally:
+            self.fetcher.close()
+        self.stdout.write(f'{self.fetcher.cache_hits} responses served from the conditional cache.')
+
+    def _import(self, news_url, full, restart):
+        state = self._load_state()
+        if restart:
+            state['pending'] = []
+
+        if state['pending']:
+            articles = state['pending']
+            self.stdout.write(f'Resuming interrupted run: {len(articles)} articles left')
+        else:
+            articles = self._collect_articles(news_url, full, state['high_water'])
+            if articles:
+                # The first card on page 1 is the newest article on the site
+                state['high_water'] = articles[0]['url']
 
         self.stdout.write(f'\nTotal articles found: {len(articles)}')
 
-        # Process each article
-        created_count = 0
+        # Skip untitled and already imported articles with a single query
+        pending = []
         for i, art in enumerate(articles, 1):
-            title = art['title']
-            if not title:
+            if not art['title']:
                 self.stdout.write(f'  [{i}] Skipping article with no title: {art["url"]}')
                 continue
-
-            slug = slugify(title)[:500]
-            if News.objects.filter(slug=slug).exists():
-                self.stdout.write(f'  [{i}] Already exists: {title[:60]}')
+            art['slug'] = slugify(art['title'])[:500]
+            pending.append((i, art))
+        existing = set(News.objects.filter(slug__in=[a['slug'] for _, a in pending]).values_list('slug', flat=True))
+        unique = []
+        for i, art in pending:
+            if art['slug'] in existing:
+                self.stdout.write(f'  [{i}] Already exists: {art["title"][:60]}')
                 continue
+            # Two cards with the same title in one run would share a slug
+            existing.add(art['slug'])
+            unique.append((i, art))
+        pending = unique
 
-            self.stdout.write(f'  [{i}] Processing: {title[:60]}...')
-
-            # Parse date (MM/DD/YYYY format)
-            published_date = self._parse_date(art['date_text'])
-
-            # Fetch full article content
-            content, featured_img_url = self._fetch_article(art['url'])
-
-            # Prefer thumbnail from listing page (unique per article),
-            # fallback to article page's featured image (often a site-wide default)
-            img_url = art['thumb_url'] or featured_img_url
-
-            # Create News object
-            news = News(
-                title=title,
-                slug=slug,
-                excerpt=art['excerpt'][:500] if art['excerpt'] else '',
-                content=content,
-                published_date=published_date,
-                source_url=art['url'],
-            )
-
-            # Download and attach image
-            if img_url:
-                try:
-                    img_resp = requests.get(img_url, headers=HEADERS, timeout=30)
-                    if img_resp.status_code == 200:
-                        ext = self._get_extension(img_url, img_resp.headers.get('content-type', ''))
-                        filename = f'{slug[:80]}{ext}'
-                        news.image.save(filename, ContentFile(img_resp.content), save=False)
-                except Exception as e:
-                    self.stdout.write(f'    Image download failed: {e}')
-
-            news.save()
-            created_count += 1
-            self.stdout.write(self.style.SUCCESS(f'    Created: {title[:60]}'))
+        state['pending'] = [art for _, art in pending]
+        self._save_state(state)
+
+        # Articles and their images are downloaded concurrently in batches;
+        # records are written from this thread and checkpointed per batch
+        self.stdout.write(f'Downloading {len(pending)} new articles...')
+        created_count = 0
+        batch_size = self.fetcher.workers * 2
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            bundles = self.fetcher.map(self._fetch_bundle, [art for _, art in batch])
+            for (i, art), (content, image) in zip(batch, bundles):
+                self._create_news(i, art, content, image)
+                created_count += 1
+            state['pending'] = [art for _, art in pending[start + batch_size:]]
+            self._save_state(state)
 
         self.stdout.write(self.style.SUCCESS(f'\nDone! Created {created_count} news articles.'))
 
+    def _collect_articles(self, news_url, full, high_water):
+        """Collect article cards from the list pages, newest first.
+
+        Unless ``full`` is set, pages are read one at a time and the crawl stops
+        at the first page holding the high-water mark or an imported article.
+        With ``full`` all pages are fetched in parallel.
+        """
+        page_urls = [news_url if n == 1 else f'{news_url}page/{n}/' for n in range(1, 10)]
+        if full:
+            self.stdout.write(f'Fetching {len(page_urls)} list pages...')
+            pages = self.fetcher.map(self._fetch_list_page, page_urls)
+        else:
+            pages = map(self._fetch_list_page, page_urls)
+
+        articles = []
+        for page_num, result in enumerate(pages, 1):
+            if isinstance(result, str):
+                self.stdout.write(f'  Page {page_num} {result}, stopping.')
+                break
+            if not result:
+                self.stdout.write(f'  No articles found on page {page_num}, stopping.')
+                break
+            articles.extend(result)
+            self.stdout.write(f'  Found {len(result)} articles on page {page_num}')
+            if not full and self._reaches_imported(result, high_water):
+                self.stdout.write(f'  Page {page_num} reaches already imported articles, stopping.')
+                break
+        return articles
+
+    def _reaches_imported(self, page_articles, high_water):
+        if high_water and any(art['url'] == high_water for art in page_articles):
+            return True
+        slugs = [slugify(art['title'])[:500] for art in page_articles if art['title']]
+        return News.objects.filter(slug__in=slugs).exists()
+
+    def _create_news(self, i, art, content, image):
+        title = art['title']
+        self.stdout.write(f'  [{i}] Processing: {title[:60]}...')
+
+        news = News(
+            title=title,
+            slug=art['slug'],
+            excerpt=art['excerpt'][:500] if art['excerpt'] else '',
+            content=content,
+            published_date=self._parse_date(art['date_text']),
+            source_url=art['url'],
+        )
+        if image:
+            data, ext = image
+            news.image.save(f'{art["slug"][:80]}{ext}', ContentFile(data), save=False)
+
+        news.save()
+        self.stdout.write(self.style.SUCCESS(f'    Created: {title[:60]}'))
+
+    def _load_state(self):
+        try:
+            state = json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            state = {}
+        state.setdefault('high_water', '')
+        state.setdefault('pending', [])
+        return state
+
+    def _save_state(self, state):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.state_path, json.dumps(state, ensure_ascii=False, indent=2).encode())
+
+    def _fetch_list_page(self, url):
+        """Return the article cards on a list page, or an error description."""
+        try:
+            resp = self.fetcher.get(url)
+        except Exception as e:
+            return f'fetch error: {e}'
+        if resp.status_code != 200:
+            return f'returned {resp.status_code}'
+
+        soup = BeautifulSoup(resp.text, 'html.parser')
+        items = soup.select('.blog-posts .item')
+        if not items:
+            # Try alternative selectors
+            items = soup.select('article') or soup.select('.post')
+
+        articles = []
+        for item in items:
+            link_tag = item.find('a', href=True)
+            if not link_tag:
+                continue
+            article_url = link_tag['href']
+            if not article_url.startswith('http'):
+                article_url = urljoin(self.base_url, article_url)
+
+            # Get thumbnail image
+            img_tag = item.find('img')
+            thumb_url = ''
+            if img_tag:
+                thumb_url = img_tag.get('src', '') or img_tag.get('data-src', '')
+
+            # Get date from the card
+            date_el = item.select_one('.date')
+            date_text = ''
+            if date_el:
+                date_text = date_el.get_text(strip=True)
+
+            # Get title
+            title_el = item.find('h4') or item.find('h3') or item.find('h2')
+            title = title_el.get_text(strip=True) if title_el else ''
+
+            # Get excerpt
+            excerpt_el = item.find('p')
+            excerpt = excerpt_el.get_text(strip=True) if excerpt_el else ''
+
+            articles.append({
+                'url': article_url,
+                'thumb_url': thumb_url,
+                'date_text': date_text,
+                'title': title,
+                'excerpt': excerpt,
+            })
+        return articles
+
+    def _fetch_bundle(self, art):
+        """Fetch an article's content and its image as ``(content, (bytes, ext))``."""
+        content, featured_img_url = self._fetch_article(art['url'])
+
+        # Prefer thumbnail from listing page (unique per article),
+        # fallback to article page's featured image (often a site-wide default)
+        img_url = art['thumb_url'] or featured_img_url
+        if not img_url:
+            return content, None
+        img_url = urljoin(art['url'], img_url)
+        try:
+            img_resp = self.fetcher.get(img_url)
+            if img_resp.status_code == 200:
+                ext = self._get_extension(img_url, img_resp.headers.get('content-type', ''))
+                return content, (img_resp.content, ext)
+        except Exception as e:
+            self.stdout.write(f'    Image download failed: {e}')
+        return content, None
+
     def _parse_date(self, date_text):
         """Parse date from MM/DD/YYYY or other formats."""
         if not date_text:
@@ -165,7 +273,7 @@ class Command(BaseCommand):
     def _fetch_article(self, url):
         """Fetch full article content and featured image."""
         try:
-            resp = requests.get(url, headers=HEADERS, timeout=30)
+            resp = self.fetcher.get(url)
             if resp.status_code != 200:
                 return '', ''
 
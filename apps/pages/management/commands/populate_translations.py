@@ -1,31 +1,77 @@
-"""Populate EN, RU, UK translations for all DB records."""
-from django.core.management.base import BaseCommand
+"""Populate EN, RU, UK translations for all DB records.
+
+All models are written in one transaction, one bulk UPDATE per model,
+touching only the translated columns whose value actually changes, so
+re-running the command is cheap and idempotent. Use --dry-run to list the
+changes without writing them.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from modeltranslation.translator import translator
+
+from apps.pages.cache import invalidate_model
+
+TRANSLATED_LANGUAGES = ('en', 'ru', 'uk')
 
 
 class Command(BaseCommand):
     help = 'Populate translations for all models'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Report changed fields without saving')
+
     def handle(self, *args, **options):
-        self._translate_statistics()
-        self._translate_partners()
-        self._translate_eu_projects()
-        self._translate_documents()
-        self._translate_success_stories()
-        self._translate_news()
-        self.stdout.write(self.style.SUCCESS('All translations populated.'))
+        self.dry_run = options['dry_run']
+        with transaction.atomic():
+            self._translate_statistics()
+            self._translate_partners()
+            self._translate_eu_projects()
+            self._translate_documents()
+            self._translate_success_stories()
+            self._translate_news()
+        if self.dry_run:
+            self.stdout.write(self.style.SUCCESS('Dry run, nothing saved.'))
+        else:
+            self.stdout.write(self.style.SUCCESS('All translations populated.'))
 
-    def _bulk_update(self, model, data, fields):
-        """Update records by ID with translation data."""
+    def _bulk_update(self, model, data):
+        """Update records by ID with translation data, writing only changed fields."""
+        options = translator.get_options_for_model(model)
+        allowed = {f'{name}_{lang}' for name in options.fields for lang in TRANSLATED_LANGUAGES}
+        unknown = {field for translations in data.values() for field in translations} - allowed
+        if unknown:
+            raise CommandError(f'{model.__name__}: not translated columns: {", ".join(sorted(unknown))}')
+
+        objects = model.objects.in_bulk(list(data))
+        changed = []
+        changed_fields = set()
         for record_id, translations in data.items():
-            try:
-                obj = model.objects.get(id=record_id)
-                for field, value in translations.items():
-                    setattr(obj, field, value)
-                obj.save()
-                self.stdout.write(f'  Updated {model.__name__} #{record_id}')
-            except model.DoesNotExist:
+            obj = objects.get(record_id)
+            if obj is None:
                 self.stdout.write(self.style.WARNING(
                     f'  {model.__name__} #{record_id} not found, skipping'))
+                continue
+            diff = {field: value for field, value in translations.items() if getattr(obj, field) != value}
+            if not diff:
+                continue
+            for field, value in diff.items():
+                if self.dry_run:
+                    self.stdout.write(f'  {model.__name__} #{record_id}.{field}: '
+                                      f'{self._preview(getattr(obj, field))} -> {self._preview(value)}')
+                setattr(obj, field, value)
+            changed.append(obj)
+            changed_fields.update(diff)
+
+        self.stdout.write(f'  {len(changed)} of {len(data)} {model.__name__} records changed')
+        if changed and not self.dry_run:
+            model.objects.bulk_update(changed, sorted(changed_fields), batch_size=100)
+            # bulk_update sends no signals, so drop cached pages explicitly
+            transaction.on_commit(lambda: invalidate_model(model))
+
+    @staticmethod
+    def _preview(value, length=60):
+        value = repr(value)
+        return value if len(value) <= length else value[:length] + '...'
 
     def _translate_statistics(self):
         from apps.pages.models import Statistic
@@ -112,7 +158,7 @@ class Command(BaseCommand):
                 'label_uk': 'заявок на розгляді', 'suffix_uk': '',
             },
         }
-        self._bulk_update(Statistic, data, [])
+        self._bulk_update(Statistic, data)
 
     def _translate_partners(self):
         from apps.pages.models import Partner
@@ -167,7 +213,7 @@ class Command(BaseCommand):
                 'description_uk': 'Програми фінансування та розвитку',
             },
         }
-        self._bulk_update(Partner, data, [])
+        self._bulk_update(Partner, data)
 
     def _translate_eu_projects(self):
         from apps.pages.models import EUProject
@@ -223,7 +269,7 @@ class Command(BaseCommand):
                 'description_uk': 'Глобальна мережа підприємництва для молоді',
             },
         }
-        self._bulk_update(EUProject, data, [])
+        self._bulk_update(EUProject, data)
 
     def _translate_documents(self):
         from apps.pages.models import Document
@@ -255,20 +301,20 @@ class Command(BaseCommand):
                 'title_uk': 'Декларація внутрішнього управлінського контролю І.П. CMDA за 2025 рік',
             },
         }
-        self._bulk_update(Document, data, [])
+        self._bulk_update(Document, data)
 
     def _translate_success_stories(self):
         from apps.pages.models import SuccessStory
         self.stdout.write('Translating Success Stories...')
         # Defined in _get_success_story_data() to keep this method clean
         data = self._get_success_story_data()
-        self._bulk_update(SuccessStory, data, [])
+        self._bulk_update(SuccessStory, data)
 
     def _translate_news(self):
         from apps.pages.models import News
         self.stdout.write('Translating News...')
         data = self._get_news_data()
-        self._bulk_update(News, data, [])
+        self._bulk_update(News, data)
 
     def _get_success_story_data(self):
         return {
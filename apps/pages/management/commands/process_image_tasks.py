@@ -0,0 +1,63 @@
+"""
+Worker that processes queued image tasks (EXIF stripping, optimisation and
+responsive derivatives) outside the admin request.
+
+Usage:
+    python manage.py process_image_tasks            # run forever
+    python manage.py process_image_tasks --once     # drain the queue and exit
+    python manage.py process_image_tasks --enqueue-all
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.pages import tasks
+from apps.pages.images import IMAGE_FIELDS
+
+
+class Command(BaseCommand):
+    help = 'Process queued image tasks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Exit when the queue is empty')
+        parser.add_argument('--sleep', type=float, default=5.0, help='Seconds to wait when the queue is empty')
+        parser.add_argument('--enqueue-all', action='store_true',
+                            help='Queue every existing image before processing')
+
+    def handle(self, *args, **options):
+        if options['enqueue_all']:
+            self._enqueue_all()
+
+        stale = tasks.requeue_stale()
+        if stale:
+            self.stdout.write(f'Requeued {stale} stale tasks')
+
+        processed = 0
+        while True:
+            # Recycle the connection between tasks the way requests do, so
+            # CONN_MAX_AGE and the health checks apply to the worker too
+            close_old_connections()
+            task = tasks.claim_next()
+            if task is None:
+                if options['once']:
+                    break
+                time.sleep(options['sleep'])
+                continue
+            tasks.run(task)
+            processed += 1
+            if task.status == 'done':
+                self.stdout.write(f'  {task}')
+            else:
+                self.stdout.write(self.style.WARNING(f'  {task}: {task.error}'))
+
+        self.stdout.write(self.style.SUCCESS(f'Done! Processed {processed} tasks.'))
+
+    def _enqueue_all(self):
+        for model, fields in IMAGE_FIELDS.items():
+            count = 0
+            for obj in model.objects.all().iterator():
+                if any(getattr(obj, name) for name in fields):
+                    tasks.enqueue(obj)
+                    count += 1
+            self.stdout.write(f'Queued {count} {model._meta.verbose_name_plural}')
@@ -0,0 +1,28 @@
+"""
+Repair the stored photo_count/image_count counters.
+
+Usage:
+    python manage.py recount
+
+The counters are kept up to date by signals on GalleryPhoto and NewsImage;
+bulk operations and raw SQL bypass those, so this recomputes every counter
+that no longer matches the child table.
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.pages.cache import invalidate_model
+from apps.pages.counters import recount
+
+
+class Command(BaseCommand):
+    help = 'Recompute drifted photo and image counters'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            fixed = recount()
+        for model, count in fixed.items():
+            if count:
+                invalidate_model(model)
+            self.stdout.write(f'{model._meta.verbose_name_plural}: {count} fixed')
+        self.stdout.write(self.style.SUCCESS('Done!'))
@@ -0,0 +1,59 @@
+"""
+Generate a large, reproducible dataset for scale testing.
+
+Usage:
+    python manage.py seed_scale --news 10000 --images-per-news 5 --events 500 --photos-per-event 40
+    python manage.py seed_scale --clear
+
+All rows are created with bulk_create, translated into every
+MODELTRANSLATION_LANGUAGES language, and derived from --seed, so two runs
+with the same arguments produce identical data. Image and document fields
+point at placeholder paths; no files are written.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.pages.seeding import ContentSeeder, clear_seeded_content
+
+
+class Command(BaseCommand):
+    help = 'Generate synthetic content for scale testing'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--news', type=int, default=1000, help='News articles')
+        parser.add_argument('--images-per-news', type=int, default=3, help='Gallery images per article')
+        parser.add_argument('--events', type=int, default=100, help='Gallery events')
+        parser.add_argument('--photos-per-event', type=int, default=20, help='Photos per gallery event')
+        parser.add_argument('--documents', type=int, default=600, help='Documents, spread over all categories')
+        parser.add_argument('--supporting', type=int, default=20,
+                            help='Stories, partners, programs, EU projects and mentors')
+        parser.add_argument('--paragraphs', type=int, default=5, help='Paragraphs per HTML body')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed')
+        parser.add_argument('--clear', action='store_true', help='Only delete previously seeded rows')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        with transaction.atomic():
+            deleted = clear_seeded_content()
+            if deleted:
+                self.stdout.write(f'Deleted {deleted} previously seeded rows')
+            if not options['clear']:
+                # call_command() passes stdout/stderr through options too
+                options.pop('stdout', None)
+                options.pop('stderr', None)
+                seed(self.stdout, **options)
+        self.stdout.write(self.style.SUCCESS(f'Done in {time.perf_counter() - start:.1f}s.'))
+
+
+def seed(stdout, **options):
+    seeder = ContentSeeder(seed=options['seed'], paragraphs=options['paragraphs'])
+    stdout.write(f'Seeding {options["news"]} news with {options["images_per_news"]} images each...')
+    seeder.news(options['news'], options['images_per_news'])
+    stdout.write(f'Seeding {options["events"]} gallery events with {options["photos_per_event"]} photos each...')
+    seeder.gallery(options['events'], options['photos_per_event'])
+    stdout.write(f'Seeding {options["documents"]} documents...')
+    seeder.documents(options['documents'])
+    stdout.write(f'Seeding {options["supporting"]} supporting rows per model...')
+    seeder.supporting(options['supporting'])
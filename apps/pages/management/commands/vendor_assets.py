@@ -0,0 +1,151 @@
+"""
+Self-host the fonts, icons and AOS library instead of loading them from CDNs.
+
+Usage:
+    python manage.py vendor_assets
+    python manage.py vendor_assets --dry-run   # list the icons that would be kept
+
+Writes to static/vendor/ (commit the result):
+  - fonts/: Merriweather 300/400/700/900 as WOFF2, limited to the latin,
+    latin-ext, cyrillic and cyrillic-ext unicode ranges (Romanian, English,
+    Russian, Ukrainian), with an @font-face stylesheet;
+  - fontawesome/sprite.svg: one <symbol> per Font Awesome icon referenced
+    by the templates, JS, Python sources or an icon_class field in the DB;
+  - aos/: aos.js and aos.css;
+  - manifest.json: read by {% vendored_assets %} to switch the templates
+    from the CDN links to these files.
+
+Re-run it after adding new icons.
+"""
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.html import escape
+
+from apps.pages.assets import parse_icon
+from apps.pages.fetch import Fetcher
+from apps.pages.models import Program, Statistic
+
+FONT_CSS_URL = 'https://fonts.googleapis.com/css2?family=Merriweather:wght@300;400;700;900&display=swap'
+FONT_SUBSETS = ('cyrillic-ext', 'cyrillic', 'latin-ext', 'latin')
+# Google serves WOFF2 with unicode-range subsets only to modern browsers
+FONT_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+    'Chrome/124.0 Safari/537.36'
+)
+FA_METADATA_URL = 'https://cdn.jsdelivr.net/npm/@fortawesome/fontawesome-free@6.5.1/metadata/icons.json'
+AOS_URLS = {
+    'aos.js': 'https://unpkg.com/aos@2.3.1/dist/aos.js',
+    'aos.css': 'https://unpkg.com/aos@2.3.1/dist/aos.css',
+}
+
+# A style class and the classes after it, e.g. "fas fa-fw fa-star leg-item-arrow"
+ICON_CLASSES = re.compile(r'\b(?:fas|far|fab|fa-solid|fa-regular|fa-brands)(?:[ \t]+[\w-]+)+')
+FONT_FACE = re.compile(r'/\*\s*([\w-]+)\s*\*/\s*(@font-face\s*\{[^}]*\})')
+FONT_URL = re.compile(r'url\((https://[^)]+)\)')
+
+
+class Command(BaseCommand):
+    help = 'Download and self-host fonts, Font Awesome icons and AOS'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Only list the referenced icons')
+
+    def handle(self, *args, **options):
+        icons = self._referenced_icons()
+        self.stdout.write(f'{len(icons)} icons referenced')
+        if options['dry_run']:
+            for style, name in sorted(icons):
+                self.stdout.write(f'  {style} {name}')
+            return
+
+        out = Path(settings.BASE_DIR) / 'static' / 'vendor'
+        fetcher = Fetcher(workers=4, rate=0, headers={'User-Agent': FONT_USER_AGENT})
+        try:
+            manifest = {
+                'fonts_css': self._fonts(fetcher, out / 'fonts'),
+                'icon_sprite': self._sprite(fetcher, out / 'fontawesome', icons),
+                **self._aos(fetcher, out / 'aos'),
+            }
+        finally:
+            fetcher.close()
+        (out / 'manifest.json').write_text(json.dumps(manifest, indent=2) + '\n')
+        self.stdout.write(self.style.SUCCESS(f'Done! Vendored assets written to {out}.'))
+
+    def _get(self, fetcher, url):
+        response = fetcher.get(url)
+        if response.status_code != 200:
+            raise CommandError(f'{url}: HTTP {response.status_code}')
+        return response
+
+    def _referenced_icons(self):
+        """``{(style, name)}`` for every icon class in the sources and the DB."""
+        base = Path(settings.BASE_DIR)
+        texts = [
+            path.read_text(encoding='utf-8')
+            for pattern in ('templates/**/*.html', 'static/js/*.js', 'apps/**/*.py')
+            for path in base.glob(pattern)
+        ]
+        texts += Program.objects.values_list('icon_class', flat=True)
+        texts += Statistic.objects.values_list('icon_class', flat=True)
+        icons = (parse_icon(classes) for text in texts for classes in ICON_CLASSES.findall(text))
+        return {icon for icon in icons if icon}
+
+    def _fonts(self, fetcher, directory):
+        directory.mkdir(parents=True, exist_ok=True)
+        css = self._get(fetcher, FONT_CSS_URL).text
+        faces = [face for subset, face in FONT_FACE.findall(css) if subset in FONT_SUBSETS]
+        if not faces:
+            raise CommandError('No matching @font-face rules in the Google Fonts response')
+
+        def download(url):
+            name = f'merriweather-{hashlib.sha1(url.encode()).hexdigest()[:10]}.woff2'
+            path = directory / name
+            if not path.exists():
+                path.write_bytes(self._get(fetcher, url).content)
+            return url, name
+
+        urls = sorted({url for face in faces for url in FONT_URL.findall(face)})
+        names = dict(fetcher.map(download, urls))
+        local_css = '\n'.join(FONT_URL.sub(lambda m: f'url({names[m[1]]})', face) for face in faces)
+        (directory / 'merriweather.css').write_text(local_css + '\n')
+        self.stdout.write(f'  fonts: {len(faces)} faces, {len(names)} files')
+        return 'vendor/fonts/merriweather.css'
+
+    def _sprite(self, fetcher, directory, icons):
+        directory.mkdir(parents=True, exist_ok=True)
+        metadata = self._get(fetcher, FA_METADATA_URL).json()
+        # Font Awesome 6 renamed many v5 icons; the old names are kept as aliases
+        canonical = {}
+        for name, icon in metadata.items():
+            canonical[name] = name
+            for alias in (icon.get('aliases') or {}).get('names', []):
+                canonical.setdefault(alias, name)
+
+        symbols, missing = [], []
+        for style, name in sorted(icons):
+            svg = metadata.get(canonical.get(name), {}).get('svg', {}).get(style)
+            if not svg:
+                missing.append(f'{style} {name}')
+                continue
+            symbols.append(
+                f'<symbol id="{style}-{escape(name)}" viewBox="{" ".join(map(str, svg["viewBox"]))}">'
+                f'<path d="{svg["path"]}"/></symbol>'
+            )
+        sprite = '<svg xmlns="http://www.w3.org/2000/svg">' + ''.join(symbols) + '</svg>\n'
+        (directory / 'sprite.svg').write_text(sprite)
+        for icon in missing:
+            self.stdout.write(self.style.WARNING(f'  icon not found: {icon}'))
+        self.stdout.write(f'  icons: {len(symbols)} symbols, {len(sprite)} bytes')
+        return 'vendor/fontawesome/sprite.svg'
+
+    def _aos(self, fetcher, directory):
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, url in AOS_URLS.items():
+            (directory / name).write_bytes(self._get(fetcher, url).content)
+        self.stdout.write('  aos: aos.js, aos.css')
+        return {'aos_js': 'vendor/aos/aos.js', 'aos_css': 'vendor/aos/aos.css'}
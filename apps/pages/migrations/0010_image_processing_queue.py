@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0009_add_declaratii_category'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='galleryphoto',
+            name='processing_status',
+            field=models.CharField(choices=[('pending', 'În așteptare'), ('processing', 'În procesare'), ('done', 'Procesat'), ('failed', 'Eșuat')], default='pending', editable=False, max_length=20, verbose_name='Procesare'),
+        ),
+        migrations.AddField(
+            model_name='newsimage',
+            name='processing_status',
+            field=models.CharField(choices=[('pending', 'În așteptare'), ('processing', 'În procesare'), ('done', 'Procesat'), ('failed', 'Eșuat')], default='pending', editable=False, max_length=20, verbose_name='Procesare'),
+        ),
+        migrations.CreateModel(
+            name='ImageTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_label', models.CharField(max_length=100, verbose_name='Model')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='ID obiect')),
+                ('status', models.CharField(choices=[('pending', 'În așteptare'), ('processing', 'În procesare'), ('done', 'Procesat'), ('failed', 'Eșuat')], default='pending', max_length=20, verbose_name='Status')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Încercări')),
+                ('error', models.TextField(blank=True, verbose_name='Eroare')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Data creării')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Actualizat')),
+            ],
+            options={
+                'verbose_name': 'Sarcină imagine',
+                'verbose_name_plural': 'Sarcini imagini',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='pages_image_status_6582d0_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0010_image_processing_queue'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='news',
+            options={'ordering': ['-published_date', '-id'], 'verbose_name': 'Comunicat', 'verbose_name_plural': 'Comunicate'},
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['-published_date', '-id'], name='news_published_id_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:35
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_counts(apps, schema_editor):
+    GalleryEvent = apps.get_model('pages', 'GalleryEvent')
+    News = apps.get_model('pages', 'News')
+    for event in GalleryEvent.objects.annotate(n=Count('photos')).filter(n__gt=0):
+        GalleryEvent.objects.filter(pk=event.pk).update(photo_count=event.n)
+    for news in News.objects.annotate(n=Count('images')).filter(n__gt=0):
+        News.objects.filter(pk=news.pk).update(image_count=news.n)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0011_news_keyset_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='galleryevent',
+            name='photo_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Fotografii'),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='image_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Imagini galerie'),
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
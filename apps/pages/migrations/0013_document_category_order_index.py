@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0012_denormalized_counts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['category', '-order'], name='document_category_order_idx'),
+        ),
+    ]
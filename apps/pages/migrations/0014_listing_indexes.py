@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:46
+
+from django.db import migrations, models
+
+from apps.pages.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('pages', '0013_document_category_order_index'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='euproject',
+            index=models.Index(fields=['order'], name='euproject_order_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='galleryevent',
+            index=models.Index(fields=['order', '-event_date'], name='gallery_event_order_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='galleryphoto',
+            index=models.Index(fields=['event', 'order', 'id'], name='gallery_photo_event_order_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='mentor',
+            index=models.Index(fields=['is_active', 'order'], name='mentor_active_order_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='newsimage',
+            index=models.Index(fields=['news', 'order', 'id'], name='news_image_news_order_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='partner',
+            index=models.Index(fields=['is_active', 'order'], name='partner_active_order_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='program',
+            index=models.Index(fields=['order'], name='program_order_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='statistic',
+            index=models.Index(fields=['category', 'order'], name='statistic_category_order_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='successstory',
+            index=models.Index(fields=['order', '-created_at'], name='story_order_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='successstory',
+            index=models.Index(fields=['is_featured', 'order', '-created_at'], name='story_featured_order_idx'),
+        ),
+    ]
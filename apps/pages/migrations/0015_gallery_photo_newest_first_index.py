@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+from apps.pages.operations import AddIndexConcurrently, RemoveIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # (CREATE|DROP) INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('pages', '0014_listing_indexes'),
+    ]
+
+    operations = [
+        # Build the new index before dropping the old one, so the event
+        # page always has one to use
+        AddIndexConcurrently(
+            model_name='galleryphoto',
+            index=models.Index(fields=['event', 'order', '-id'], name='gallery_photo_order_newest_idx'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='galleryphoto',
+            name='gallery_photo_event_order_idx',
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0015_gallery_photo_newest_first_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='galleryevent',
+            name='cover_image_height',
+            field=models.PositiveIntegerField(editable=False, null=True, verbose_name='Înălțime'),
+        ),
+        migrations.AddField(
+            model_name='galleryevent',
+            name='cover_image_width',
+            field=models.PositiveIntegerField(editable=False, null=True, verbose_name='Lățime'),
+        ),
+        migrations.AddField(
+            model_name='galleryphoto',
+            name='image_height',
+            field=models.PositiveIntegerField(editable=False, null=True, verbose_name='Înălțime'),
+        ),
+        migrations.AddField(
+            model_name='galleryphoto',
+            name='image_width',
+            field=models.PositiveIntegerField(editable=False, null=True, verbose_name='Lățime'),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='image_height',
+            field=models.PositiveIntegerField(editable=False, null=True, verbose_name='Înălțime'),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='image_width',
+            field=models.PositiveIntegerField(editable=False, null=True, verbose_name='Lățime'),
+        ),
+        migrations.AddField(
+            model_name='newsimage',
+            name='image_height',
+            field=models.PositiveIntegerField(editable=False, null=True, verbose_name='Înălțime'),
+        ),
+        migrations.AddField(
+            model_name='newsimage',
+            name='image_width',
+            field=models.PositiveIntegerField(editable=False, null=True, verbose_name='Lățime'),
+        ),
+        migrations.AddField(
+            model_name='partner',
+            name='logo_height',
+            field=models.PositiveIntegerField(editable=False, null=True, verbose_name='Înălțime'),
+        ),
+        migrations.AddField(
+            model_name='partner',
+            name='logo_width',
+            field=models.PositiveIntegerField(editable=False, null=True, verbose_name='Lățime'),
+        ),
+        migrations.AddField(
+            model_name='successstory',
+            name='image_height',
+            field=models.PositiveIntegerField(editable=False, null=True, verbose_name='Înălțime'),
+        ),
+        migrations.AddField(
+            model_name='successstory',
+            name='image_width',
+            field=models.PositiveIntegerField(editable=False, null=True, verbose_name='Lățime'),
+        ),
+    ]
@@ -1,8 +1,23 @@
 from django.db import models
 from django.utils.text import slugify
 
+IMAGE_STATUS_CHOICES = [
+    ('pending', 'În așteptare'),
+    ('processing', 'În procesare'),
+    ('done', 'Procesat'),
+    ('failed', 'Eșuat'),
+]
+
+
+class ListingQuerySet(models.QuerySet):
+    def for_listing(self):
+        """Skip the long HTML columns (in every language) that listing pages never render."""
+        return self.defer(*self.model.LISTING_DEFERRED_FIELDS)
+
 
 class SuccessStory(models.Model):
+    LISTING_DEFERRED_FIELDS = ('content', 'quote')
+
     title = models.CharField('Titlu', max_length=300)
     slug = models.SlugField('Slug', unique=True)
     company_name = models.CharField('Companie', max_length=200)
@@ -10,13 +25,22 @@ class SuccessStory(models.Model):
     short_description = models.TextField('Descriere scurtă', help_text='Previzualizare pe pagina principală')
     content = models.TextField('Conținut complet', help_text='HTML permis')
     image = models.ImageField('Imagine', upload_to='stories/')
+    # Pixel size of the processed upload, set once its derivatives exist (images.py)
+    image_width = models.PositiveIntegerField('Lățime', null=True, editable=False)
+    image_height = models.PositiveIntegerField('Înălțime', null=True, editable=False)
     quote = models.TextField('Citat fondator', blank=True)
     is_featured = models.BooleanField('Pe pagina principală', default=False)
     order = models.IntegerField('Ordine', default=0)
     created_at = models.DateTimeField('Data creării', auto_now_add=True)
 
+    objects = ListingQuerySet.as_manager()
+
     class Meta:
         ordering = ['order', '-created_at']
+        indexes = [
+            models.Index(fields=['order', '-created_at'], name='story_order_idx'),
+            models.Index(fields=['is_featured', 'order', '-created_at'], name='story_featured_order_idx'),
+        ]
         verbose_name = 'Istorie de succes'
         verbose_name_plural = 'Istorii de succes'
 
@@ -37,6 +61,8 @@ class Partner(models.Model):
 
     name = models.CharField('Nume', max_length=200)
     logo = models.ImageField('Logo', upload_to='partners/')
+    logo_width = models.PositiveIntegerField('Lățime', null=True, editable=False)
+    logo_height = models.PositiveIntegerField('Înălțime', null=True, editable=False)
     website_url = models.URLField('Website', blank=True)
     description = models.TextField('Descriere', blank=True)
     partner_type = models.CharField('Tip', max_length=20, choices=PARTNER_TYPES, default='internal')
@@ -45,6 +71,7 @@ class Partner(models.Model):
 
     class Meta:
         ordering = ['order']
+        indexes = [models.Index(fields=['is_active', 'order'], name='partner_active_order_idx')]
         verbose_name = 'Partener'
         verbose_name_plural = 'Parteneri'
 
@@ -66,6 +93,7 @@ class EUProject(models.Model):
 
     class Meta:
         ordering = ['order']
+        indexes = [models.Index(fields=['order'], name='euproject_order_idx')]
         verbose_name = 'Proiect european'
         verbose_name_plural = 'Proiecte europene'
 
@@ -77,13 +105,17 @@ class GalleryEvent(models.Model):
     title = models.CharField('Titlu', max_length=300)
     slug = models.SlugField('Slug', max_length=300, unique=True)
     cover_image = models.ImageField('Imagine copertă', upload_to='gallery/events/')
+    cover_image_width = models.PositiveIntegerField('Lățime', null=True, editable=False)
+    cover_image_height = models.PositiveIntegerField('Înălțime', null=True, editable=False)
     description = models.TextField('Descriere', blank=True)
     event_date = models.DateField('Data evenimentului', null=True, blank=True)
     order = models.IntegerField('Ordine', default=0)
+    photo_count = models.PositiveIntegerField('Fotografii', default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ['order', '-event_date']
+        indexes = [models.Index(fields=['order', '-event_date'], name='gallery_event_order_idx')]
         verbose_name = 'Eveniment galerie'
         verbose_name_plural = 'Evenimente galerie'
 
@@ -100,12 +132,19 @@ class GalleryPhoto(models.Model):
     event = models.ForeignKey(GalleryEvent, on_delete=models.CASCADE, related_name='photos',
                               verbose_name='Eveniment', null=True, blank=True)
     image = models.ImageField('Imagine', upload_to='gallery/')
+    image_width = models.PositiveIntegerField('Lățime', null=True, editable=False)
+    image_height = models.PositiveIntegerField('Înălțime', null=True, editable=False)
     caption = models.CharField('Descriere', max_length=200, blank=True)
     order = models.IntegerField('Ordine', default=0)
+    processing_status = models.CharField('Procesare', max_length=20, choices=IMAGE_STATUS_CHOICES,
+                                         default='pending', editable=False)
     created_at = models.DateTimeField('Data', auto_now_add=True)
 
     class Meta:
         ordering = ['order', '-created_at']
+        # The event page pages through photos on (order, -id): newest first
+        # within an order, like the -created_at tie-break above
+        indexes = [models.Index(fields=['event', 'order', '-id'], name='gallery_photo_order_newest_idx')]
         verbose_name = 'Fotografie'
         verbose_name_plural = 'Galerie foto'
 
@@ -114,6 +153,8 @@ class GalleryPhoto(models.Model):
 
 
 class Program(models.Model):
+    LISTING_DEFERRED_FIELDS = ('content',)
+
     title = models.CharField('Titlu', max_length=300)
     slug = models.SlugField('Slug', unique=True)
     badge = models.CharField('Badge', max_length=50, help_text='Ex: Consultanță, Educație, Granturi')
@@ -128,8 +169,11 @@ class Program(models.Model):
     cta_url = models.URLField('URL buton CTA', blank=True)
     order = models.IntegerField('Ordine', default=0)
 
+    objects = ListingQuerySet.as_manager()
+
     class Meta:
         ordering = ['order']
+        indexes = [models.Index(fields=['order'], name='program_order_idx')]
         verbose_name = 'Program'
         verbose_name_plural = 'Programe'
 
@@ -161,6 +205,7 @@ class Statistic(models.Model):
 
     class Meta:
         ordering = ['category', 'order']
+        indexes = [models.Index(fields=['category', 'order'], name='statistic_category_order_idx')]
         verbose_name = 'Statistică'
         verbose_name_plural = 'Statistici'
 
@@ -178,6 +223,7 @@ class Mentor(models.Model):
 
     class Meta:
         ordering = ['order']
+        indexes = [models.Index(fields=['is_active', 'order'], name='mentor_active_order_idx')]
         verbose_name = 'Mentor'
         verbose_name_plural = 'Mentori'
 
@@ -186,17 +232,25 @@ class Mentor(models.Model):
 
 
 class News(models.Model):
+    LISTING_DEFERRED_FIELDS = ('content',)
+
     title = models.CharField('Titlu', max_length=500)
     slug = models.SlugField('Slug', unique=True, max_length=500)
     excerpt = models.TextField('Rezumat', blank=True)
     content = models.TextField('Conținut', help_text='HTML permis')
     image = models.ImageField('Imagine', upload_to='news/', blank=True)
+    image_width = models.PositiveIntegerField('Lățime', null=True, editable=False)
+    image_height = models.PositiveIntegerField('Înălțime', null=True, editable=False)
     published_date = models.DateField('Data publicării')
     source_url = models.URLField('URL sursă', blank=True)
+    image_count = models.PositiveIntegerField('Imagini galerie', default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ListingQuerySet.as_manager()
+
     class Meta:
-        ordering = ['-published_date']
+        ordering = ['-published_date', '-id']
+        indexes = [models.Index(fields=['-published_date', '-id'], name='news_published_id_idx')]
         verbose_name = 'Comunicat'
         verbose_name_plural = 'Comunicate'
 
@@ -212,11 +266,16 @@ class News(models.Model):
 class NewsImage(models.Model):
     news = models.ForeignKey(News, on_delete=models.CASCADE, related_name='images', verbose_name='Comunicat')
     image = models.ImageField('Imagine', upload_to='news/')
+    image_width = models.PositiveIntegerField('Lățime', null=True, editable=False)
+    image_height = models.PositiveIntegerField('Înălțime', null=True, editable=False)
     caption = models.CharField('Descriere', max_length=300, blank=True)
     order = models.IntegerField('Ordine', default=0)
+    processing_status = models.CharField('Procesare', max_length=20, choices=IMAGE_STATUS_CHOICES,
+                                         default='pending', editable=False)
 
     class Meta:
         ordering = ['order', 'pk']
+        indexes = [models.Index(fields=['news', 'order', 'id'], name='news_image_news_order_idx')]
         verbose_name = 'Imagine comunicat'
         verbose_name_plural = 'Imagini comunicat'
 
@@ -242,6 +301,8 @@ class Document(models.Model):
 
     class Meta:
         ordering = ['category', 'order', '-created_at']
+        # Serves the grouped transparency listings (cache.get_document_listings)
+        indexes = [models.Index(fields=['category', '-order'], name='document_category_order_idx')]
         verbose_name = 'Document'
         verbose_name_plural = 'Documente'
 
@@ -264,3 +325,23 @@ class Document(models.Model):
         elif ext in ('xls', 'xlsx'):
             return 'fas fa-file-excel'
         return 'fas fa-file-alt'
+
+
+class ImageTask(models.Model):
+    """Queued image optimisation job, run by the process_image_tasks command."""
+    model_label = models.CharField('Model', max_length=100)
+    object_id = models.PositiveBigIntegerField('ID obiect')
+    status = models.CharField('Status', max_length=20, choices=IMAGE_STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField('Încercări', default=0)
+    error = models.TextField('Eroare', blank=True)
+    created_at = models.DateTimeField('Data creării', auto_now_add=True)
+    updated_at = models.DateTimeField('Actualizat', auto_now=True)
+
+    class Meta:
+        ordering = ['created_at']
+        indexes = [models.Index(fields=['status', 'created_at'])]
+        verbose_name = 'Sarcină imagine'
+        verbose_name_plural = 'Sarcini imagini'
+
+    def __str__(self):
+        return f'{self.model_label} #{self.object_id} ({self.status})'
@@ -0,0 +1,51 @@
+"""Custom migration operations."""
+from django.db import migrations
+
+
+class AddIndexConcurrently(migrations.AddIndex):
+    """AddIndex that runs CREATE INDEX CONCURRENTLY on PostgreSQL.
+
+    The table stays writable while the index builds. Other backends get a
+    plain CREATE INDEX, so the same migration runs on the SQLite dev
+    database. Migrations using it must set ``atomic = False``.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.add_index(model, self.index, **self._concurrently(schema_editor))
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.remove_index(model, self.index, **self._concurrently(schema_editor))
+
+    def describe(self):
+        return super().describe() + ' (concurrently on PostgreSQL)'
+
+    @staticmethod
+    def _concurrently(schema_editor):
+        return {'concurrently': True} if schema_editor.connection.vendor == 'postgresql' else {}
+
+
+class RemoveIndexConcurrently(migrations.RemoveIndex):
+    """RemoveIndex that runs DROP INDEX CONCURRENTLY on PostgreSQL.
+
+    The counterpart of AddIndexConcurrently, with the same ``atomic = False``
+    requirement.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            index = from_state.models[app_label, self.model_name_lower].get_index_by_name(self.name)
+            schema_editor.remove_index(model, index, **AddIndexConcurrently._concurrently(schema_editor))
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            index = to_state.models[app_label, self.model_name_lower].get_index_by_name(self.name)
+            schema_editor.add_index(model, index, **AddIndexConcurrently._concurrently(schema_editor))
+
+    def describe(self):
+        return super().describe() + ' (concurrently on PostgreSQL)'
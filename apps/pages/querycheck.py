@@ -0,0 +1,124 @@
+"""Detection of N+1 query patterns and slow queries.
+
+``QueryInspector`` records the SELECTs run while it is active, grouped by
+fingerprint (the SQL with literals and IN lists folded), and reports:
+
+- repeated queries: one fingerprint executed ``repeat_threshold`` times or
+  more, the signature of an N+1 loop;
+- slow queries: statements slower than ``slow_ms``, with their EXPLAIN plan.
+
+Problems are logged to ``apps.pages.queries``; with ``raise_errors`` they
+also raise ``QueryProblemError`` so a test or CI run fails. Use it in tests::
+
+    with QueryInspector(raise_errors=True):
+        client.get('/galerie/')
+
+``QueryInspectorMiddleware`` runs it on every request when the
+``PAGES_QUERY_INSPECTOR`` setting is ``log`` or ``raise``, and
+``bench_pages --check-queries`` runs it over every route.
+"""
+import logging
+import re
+import time
+from collections import defaultdict
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger('apps.pages.queries')
+
+STRING_LITERAL = re.compile(r"'(?:''|[^'])*'")
+NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+IN_LIST = re.compile(r'\bIN \((?:[^()]|\([^()]*\))*\)', re.I)
+WHITESPACE = re.compile(r'\s+')
+
+
+class QueryProblemError(AssertionError):
+    pass
+
+
+def fingerprint(sql):
+    """Reduce ``sql`` to its shape, so queries differing only in values compare equal."""
+    sql = STRING_LITERAL.sub('?', sql)
+    sql = IN_LIST.sub('IN (...)', sql)
+    sql = NUMBER_LITERAL.sub('?', sql).replace('%s', '?')
+    return WHITESPACE.sub(' ', sql).strip()
+
+
+class QueryInspector:
+    def __init__(self, label='', repeat_threshold=None, slow_ms=None, raise_errors=False):
+        self.label = label
+        self.repeat_threshold = repeat_threshold or settings.PAGES_QUERY_REPEAT_THRESHOLD
+        self.slow_ms = slow_ms if slow_ms is not None else settings.PAGES_SLOW_QUERY_MS
+        self.raise_errors = raise_errors
+        self.counts = defaultdict(int)
+        self.slow = []
+        self.found = []
+        self._stack = None
+
+    def __enter__(self):
+        self._stack = ExitStack()
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stack.close()
+        if exc_type is None:
+            self.report()
+
+    def __call__(self, execute, sql, params, many, context):
+        # Installed with connection.execute_wrapper()
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            if not many and sql.lstrip()[:6].upper() == 'SELECT':
+                elapsed = (time.perf_counter() - start) * 1000
+                self.counts[fingerprint(sql)] += 1
+                if elapsed >= self.slow_ms:
+                    self.slow.append((elapsed, sql, params, context['connection']))
+
+    def problems(self):
+        """Return a description of every repeated and slow query."""
+        found = [
+            f'{count}x repeated: {sql}'
+            for sql, count in sorted(self.counts.items(), key=lambda item: -item[1])
+            if count >= self.repeat_threshold
+        ]
+        for elapsed, sql, params, connection in self.slow:
+            found.append(f'{elapsed:.1f}ms slow: {sql}\n{self._explain(connection, sql, params)}')
+        return found
+
+    def report(self):
+        self.found = self.problems()
+        for problem in self.found:
+            logger.warning('%s %s', self.label, problem)
+        if self.found and self.raise_errors:
+            raise QueryProblemError(f'{self.label} {len(self.found)} query problem(s):\n' + '\n'.join(self.found))
+
+    def _explain(self, connection, sql, params):
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(f'{connection.ops.explain_query_prefix()} {sql}', params)
+                return '\n'.join('  ' + ' '.join(str(col) for col in row) for row in cursor.fetchall())
+        except Exception as e:
+            return f'  (EXPLAIN failed: {e})'
+
+
+class QueryInspectorMiddleware:
+    """Inspect each request's queries; enabled by ``PAGES_QUERY_INSPECTOR``."""
+
+    def __init__(self, get_response):
+        mode = settings.PAGES_QUERY_INSPECTOR
+        if mode not in ('log', 'raise'):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.raise_errors = mode == 'raise'
+
+    def __call__(self, request):
+        label = f'{request.method} {request.get_full_path()}'
+        with QueryInspector(label, raise_errors=self.raise_errors):
+            return self.get_response(request)
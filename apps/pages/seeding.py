@@ -0,0 +1,187 @@
+"""Deterministic synthetic content for scale tests and benchmarks.
+
+Rows are created with bulk_create and filled in every language listed in
+MODELTRANSLATION_LANGUAGES. The same seed always produces the same data.
+Seeded rows are recognisable by SEED_PREFIX in their slug or file name,
+so clear_seeded_content() can remove them again.
+"""
+import random
+from datetime import date, timedelta
+
+from django.conf import settings
+
+from .cache import invalidate_model
+from .counters import recount
+from .models import (
+    Document, EUProject, GalleryEvent, GalleryPhoto, Mentor, News, NewsImage, Partner, Program, Statistic,
+    SuccessStory,
+)
+from .signals import receivers_disconnected
+
+SEED_PREFIX = 'seed-'
+
+WORDS = {
+    'ro': ('antreprenor afacere program grant tineri migranți dezvoltare municipiu consultanță instruire '
+           'finanțare proiect inovare parteneriat comunitate economie incubator startup mentor rezultat').split(),
+    'en': ('entrepreneur business program grant youth migrants development municipality consulting training '
+           'funding project innovation partnership community economy incubator startup mentor result').split(),
+    'ru': ('предприниматель бизнес программа грант молодёжь мигранты развитие муниципий консультация обучение '
+           'финансирование проект инновация партнёрство сообщество экономика инкубатор стартап ментор').split(),
+    'uk': ('підприємець бізнес програма грант молодь мігранти розвиток муніципій консультація навчання '
+           'фінансування проєкт інновація партнерство громада економіка інкубатор стартап ментор').split(),
+}
+
+# Paragraphs are drawn from a fixed pool so large datasets stay fast to build
+PARAGRAPH_POOL_SIZE = 200
+
+
+class ContentSeeder:
+    def __init__(self, seed=0, paragraphs=5, batch_size=1000, start_date=date(2026, 1, 1)):
+        self.rng = random.Random(seed)
+        self.paragraphs = paragraphs
+        self.batch_size = batch_size
+        self.start_date = start_date
+        self.languages = settings.MODELTRANSLATION_LANGUAGES
+        self.pool = {
+            lang: [f'<p>{self._sentence(lang, 40)}</p>' for _ in range(PARAGRAPH_POOL_SIZE)]
+            for lang in self.languages
+        }
+
+    def _sentence(self, lang, length):
+        return ' '.join(self.rng.choice(WORDS[lang]) for _ in range(length)).capitalize()
+
+    def _html(self, lang):
+        return '\n'.join(self.rng.choice(self.pool[lang]) for _ in range(self.paragraphs))
+
+    def _translated(self, **fields):
+        """Model kwargs filling ``<field>_<lang>`` for every language.
+
+        Each value is ``('words', n)`` for plain text or ``('html', None)``
+        for a body built from the paragraph pool.
+        """
+        values = {}
+        for name, (kind, length) in fields.items():
+            for lang in self.languages:
+                values[f'{name}_{lang}'] = self._html(lang) if kind == 'html' else self._sentence(lang, length)
+        return values
+
+    def _bulk_create(self, model, objects):
+        created = model.objects.bulk_create(objects, batch_size=self.batch_size)
+        # bulk_create sends no signals, so drop cached pages explicitly
+        invalidate_model(model)
+        return created
+
+    def news(self, count, images_per_news=0):
+        news = self._bulk_create(News, [
+            News(
+                slug=f'{SEED_PREFIX}news-{i}',
+                image=f'news/{SEED_PREFIX}{i % 50}.webp',
+                published_date=self.start_date - timedelta(days=i // 3),
+                image_count=images_per_news,
+                **self._translated(title=('words', 8), excerpt=('words', 30), content=('html', None)),
+            )
+            for i in range(count)
+        ])
+        self._bulk_create(NewsImage, [
+            NewsImage(news=article, image=f'news/{SEED_PREFIX}{j % 50}.webp', order=j, processing_status='done',
+                      **self._translated(caption=('words', 6)))
+            for article in news for j in range(images_per_news)
+        ])
+        return news
+
+    def gallery(self, count, photos_per_event=0):
+        events = self._bulk_create(GalleryEvent, [
+            GalleryEvent(
+                slug=f'{SEED_PREFIX}event-{i}',
+                cover_image=f'gallery/events/{SEED_PREFIX}{i % 50}.webp',
+                event_date=self.start_date - timedelta(days=i * 7),
+                order=i,
+                photo_count=photos_per_event,
+                **self._translated(title=('words', 6), description=('words', 40)),
+            )
+            for i in range(count)
+        ])
+        self._bulk_create(GalleryPhoto, [
+            GalleryPhoto(event=event, image=f'gallery/{SEED_PREFIX}{j % 50}.webp', order=j, processing_status='done',
+                         **self._translated(caption=('words', 6)))
+            for event in events for j in range(photos_per_event)
+        ])
+        return events
+
+    def documents(self, count):
+        categories = [key for key, _ in Document.CATEGORY_CHOICES]
+        return self._bulk_create(Document, [
+            Document(
+                category=categories[i % len(categories)],
+                file=f'documents/{SEED_PREFIX}{i}.pdf',
+                order=i,
+                **self._translated(title=('words', 10)),
+            )
+            for i in range(count)
+        ])
+
+    def supporting(self, count):
+        """Stories, partners, programs, EU projects, mentors and statistics."""
+        self._bulk_create(SuccessStory, [
+            SuccessStory(
+                slug=f'{SEED_PREFIX}story-{i}', image=f'stories/{SEED_PREFIX}{i % 50}.webp',
+                is_featured=i < 6, order=i,
+                **self._translated(title=('words', 6), company_name=('words', 2), category=('words', 1),
+                                   short_description=('words', 30), content=('html', None), quote=('words', 20)),
+            )
+            for i in range(count)
+        ])
+        self._bulk_create(Partner, [
+            Partner(logo=f'partners/{SEED_PREFIX}{i % 50}.webp', partner_type=('internal', 'international')[i % 2],
+                    order=i, **self._translated(name=('words', 2), description=('words', 15)))
+            for i in range(count)
+        ])
+        self._bulk_create(Program, [
+            Program(slug=f'{SEED_PREFIX}program-{i}', order=i,
+                    **self._translated(title=('words', 5), badge=('words', 1), short_description=('words', 25),
+                                       content=('html', None), highlight_text=('words', 3), cta_text=('words', 2)))
+            for i in range(count)
+        ])
+        self._bulk_create(EUProject, [
+            EUProject(order=i, status=('active', 'completed')[i % 2],
+                      **self._translated(title=('words', 6), description=('words', 30)),
+                      **{f'funder_{lang}': f'{SEED_PREFIX}funder' for lang in self.languages})
+            for i in range(count)
+        ])
+        self._bulk_create(Mentor, [
+            Mentor(photo=f'mentors/{SEED_PREFIX}{i % 50}.webp', order=i,
+                   **self._translated(name=('words', 2), specialization=('words', 2), bio=('words', 30)))
+            for i in range(count)
+        ])
+        self._bulk_create(Statistic, [
+            Statistic(key=f'{SEED_PREFIX}{category}-{i}', value=str(self.rng.randint(1, 5000)), category=category,
+                      order=i, **self._translated(label=('words', 3), suffix=('words', 1)))
+            for category, _ in Statistic.CATEGORIES for i in range(5)
+        ])
+
+
+def clear_seeded_content():
+    """Delete every row created by ContentSeeder; returns the number deleted.
+
+    The deletes run without the model signals, which would recount and
+    invalidate once per row; both happen once at the end instead.
+    """
+    prefix = SEED_PREFIX
+    querysets = [
+        News.objects.filter(slug__startswith=prefix),
+        GalleryEvent.objects.filter(slug__startswith=prefix),
+        Document.objects.filter(file__startswith=f'documents/{prefix}'),
+        SuccessStory.objects.filter(slug__startswith=prefix),
+        Partner.objects.filter(logo__startswith=f'partners/{prefix}'),
+        Program.objects.filter(slug__startswith=prefix),
+        Statistic.objects.filter(key__startswith=prefix),
+        EUProject.objects.filter(funder_ro=f'{prefix}funder'),
+        Mentor.objects.filter(photo__startswith=f'mentors/{prefix}'),
+    ]
+    with receivers_disconnected():
+        deleted = sum(qs.delete()[0] for qs in querysets)
+    recount()
+    # The cascades removed NewsImage and GalleryPhoto rows too
+    for model in [qs.model for qs in querysets] + [NewsImage, GalleryPhoto]:
+        invalidate_model(model)
+    return deleted
@@ -0,0 +1,111 @@
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
+
+from .cache import invalidate_model
+from .counters import COUNTERS, refresh_counts
+from .images import IMAGE_FIELDS, dimension_fields
+from .models import ImageTask
+from .tasks import enqueue
+
+
+def invalidate_caches(sender, **kwargs):
+    invalidate_model(sender)
+
+
+def track_new_uploads(sender, instance, **kwargs):
+    instance._new_uploads = [
+        name for name in IMAGE_FIELDS[sender]
+        if getattr(instance, name) and not getattr(instance, name)._committed
+    ]
+    # The recorded size belongs to the previous file, whose derivatives the
+    # new one does not have yet
+    for name in instance._new_uploads:
+        for field in dimension_fields(name):
+            setattr(instance, field, None)
+
+
+def enqueue_image_processing(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    has_image = any(getattr(instance, name) for name in IMAGE_FIELDS[sender])
+    if getattr(instance, '_new_uploads', None) or (created and has_image):
+        enqueue(instance)
+
+
+def remember_counted_parent(sender, instance, raw=False, **kwargs):
+    # The previous parent needs a recount too when a child is moved
+    fk, _ = COUNTERS[sender]
+    instance._counted_parent = None
+    if not raw and not instance._state.adding and instance.pk:
+        instance._counted_parent = (
+            sender.objects.filter(pk=instance.pk).values_list(f'{fk}_id', flat=True).first()
+        )
+
+
+def update_parent_count(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    fk, _ = COUNTERS[sender]
+    refresh_counts(sender, {getattr(instance, f'{fk}_id'), getattr(instance, '_counted_parent', None)})
+
+
+# {child model: parent ids} of rows deleted in this thread's transaction
+_deleted_parents = threading.local()
+
+
+def queue_parent_recount(sender, instance, **kwargs):
+    # A cascade or queryset delete sends this once per row; the parents are
+    # recounted once, after the commit. Every row registers the flush, so
+    # ids left behind by a rolled-back transaction are still flushed later.
+    fk, _ = COUNTERS[sender]
+    if not hasattr(_deleted_parents, 'ids'):
+        _deleted_parents.ids = defaultdict(set)
+    _deleted_parents.ids[sender].add(getattr(instance, f'{fk}_id'))
+    transaction.on_commit(flush_parent_recounts)
+
+
+def flush_parent_recounts():
+    pending = getattr(_deleted_parents, 'ids', None)
+    _deleted_parents.ids = defaultdict(set)
+    for child_model, parent_ids in (pending or {}).items():
+        refresh_counts(child_model, parent_ids)
+
+
+# (signal, receiver, sender) for every receiver above. Each is bound to an
+# explicit sender, so models of other apps and ImageTask keep Django's fast
+# delete path; deleting any other pages model runs the receivers per row.
+# Bulk removals can use receivers_disconnected() (see clear_seeded_content).
+RECEIVERS = [
+    (signal, invalidate_caches, model)
+    for model in apps.get_app_config('pages').get_models() if model is not ImageTask
+    for signal in (post_save, post_delete)
+]
+RECEIVERS += [(signal, receiver, model) for model in IMAGE_FIELDS
+              for signal, receiver in ((pre_save, track_new_uploads), (post_save, enqueue_image_processing))]
+RECEIVERS += [(signal, receiver, model) for model in COUNTERS
+              for signal, receiver in ((pre_save, remember_counted_parent), (post_save, update_parent_count),
+                                       (pre_delete, queue_parent_recount))]
+
+for signal, receiver, sender in RECEIVERS:
+    signal.connect(receiver, sender=sender)
+
+
+@contextmanager
+def receivers_disconnected():
+    """Run the block without the receivers above, process-wide.
+
+    Lets bulk deletes take Django's fast delete path; the caller must
+    recount and invalidate the caches itself afterwards.
+    """
+    for signal, receiver, sender in RECEIVERS:
+        signal.disconnect(receiver, sender=sender)
+    try:
+        yield
+    finally:
+        for signal, receiver, sender in RECEIVERS:
+            signal.connect(receiver, sender=sender)
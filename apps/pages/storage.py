@@ -0,0 +1,42 @@
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+from .assets import build_bundle, bundles, minify, precompress
+
+
+class BundledManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """ManifestStaticFilesStorage that also builds STATIC_BUNDLES and minifies CSS/JS.
+
+    Bundles and minified copies are written to STATIC_ROOT before hashing,
+    so the content hashes (and the manifest) describe what is served.
+    Once everything is hashed, compressible files get ``.gz``/``.br``
+    siblings for nginx to serve as-is.
+    """
+
+    def _replace(self, name, text):
+        if self.exists(name):
+            self.delete(name)
+        self._save(name, ContentFile(text.encode('utf-8')))
+
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            def read(path):
+                storage, source_path = paths[path]
+                with storage.open(source_path) as fh:
+                    return fh.read().decode('utf-8')
+
+            for bundle in bundles():
+                self._replace(bundle, build_bundle(bundle, read))
+                paths[bundle] = (self, bundle)
+
+            for name in list(paths):
+                if name.endswith(('.css', '.js')) and '.min.' not in name:
+                    storage, source_path = paths[name]
+                    with storage.open(source_path) as fh:
+                        self._replace(name, minify(name, fh.read().decode('utf-8')))
+                    paths[name] = (self, name)
+
+        yield from super().post_process(paths, dry_run, **options)
+
+        if not dry_run:
+            precompress(self.location)
@@ -0,0 +1,85 @@
+"""Database-backed queue for image processing.
+
+Saving a record with a new upload enqueues an ImageTask; the
+``process_image_tasks`` management command claims and runs them outside
+the request cycle.
+"""
+from datetime import timedelta
+
+from django.apps import apps
+from django.db import transaction
+from django.utils import timezone
+
+from .cache import invalidate_model
+from .images import process_instance_images
+from .models import GalleryPhoto, NewsImage, ImageTask
+
+MAX_ATTEMPTS = 3
+
+# Tasks left in 'processing' this long are assumed to belong to a dead worker
+STALE_AFTER = timedelta(minutes=15)
+
+STATUS_MODELS = (GalleryPhoto, NewsImage)
+
+
+def _set_image_status(model, pk, status):
+    if model in STATUS_MODELS:
+        model.objects.filter(pk=pk).update(processing_status=status)
+
+
+def enqueue(instance):
+    """Queue ``instance`` for processing unless it is already waiting."""
+    ImageTask.objects.get_or_create(
+        model_label=instance._meta.label_lower,
+        object_id=instance.pk,
+        status='pending',
+    )
+    _set_image_status(type(instance), instance.pk, 'pending')
+
+
+def retry(tasks):
+    """Send ``tasks`` back to the queue with fresh attempts; return how many."""
+    with transaction.atomic():
+        for label, object_id in tasks.values_list('model_label', 'object_id'):
+            _set_image_status(apps.get_model(label), object_id, 'pending')
+        return tasks.update(status='pending', attempts=0, error='')
+
+
+def requeue_stale():
+    cutoff = timezone.now() - STALE_AFTER
+    return ImageTask.objects.filter(status='processing', updated_at__lt=cutoff).update(status='pending')
+
+
+def claim_next():
+    """Mark the oldest pending task as processing and return it, or None."""
+    with transaction.atomic():
+        task = ImageTask.objects.select_for_update(skip_locked=True).filter(status='pending').first()
+        if task is None:
+            return None
+        task.status = 'processing'
+        task.attempts += 1
+        task.save(update_fields=['status', 'attempts', 'updated_at'])
+    return task
+
+
+def run(task):
+    """Process a claimed task and record the outcome on it and its image."""
+    model = apps.get_model(task.model_label)
+    instance = model.objects.filter(pk=task.object_id).first()
+    if instance is None:
+        task.delete()
+        return
+    _set_image_status(model, instance.pk, 'processing')
+    try:
+        process_instance_images(instance)
+    except Exception as e:
+        task.status = 'pending' if task.attempts < MAX_ATTEMPTS else 'failed'
+        task.error = str(e)
+    else:
+        task.status = 'done'
+        task.error = ''
+    task.save(update_fields=['status', 'error', 'updated_at'])
+    _set_image_status(model, instance.pk, task.status)
+    # Derivatives change the rendered srcset of pages showing this model,
+    # the homepage's cached fragments included
+    invalidate_model(model)
@@ -0,0 +1,35 @@
+from django import template
+from django.utils.safestring import mark_safe
+
+from ..critical import defer_stylesheets, load_critical_css
+
+register = template.Library()
+
+
+class CriticalCSSNode(template.Node):
+    def __init__(self, nodelist):
+        self.nodelist = nodelist
+
+    def render(self, context):
+        html = self.nodelist.render(context)
+        request = context.get('request')
+        match = getattr(request, 'resolver_match', None)
+        css = load_critical_css(match.url_name) if match and match.url_name else ''
+        if not css:
+            return html
+        css = css.replace('</', '<\\/')
+        return mark_safe(f'<style>{css}</style>\n{defer_stylesheets(html)}')
+
+
+@register.tag
+def critical_css(parser, token):
+    """Inline the page's critical CSS and defer the stylesheets inside the block.
+
+        {% critical_css %}<link rel="stylesheet" href="...">{% endcritical_css %}
+
+    Without a built artifact for the current URL name the block renders
+    unchanged.
+    """
+    nodelist = parser.parse(('endcritical_css',))
+    parser.delete_first_token()
+    return CriticalCSSNode(nodelist)
@@ -0,0 +1,47 @@
+from django import template
+from django.utils.html import format_html, format_html_join
+
+from ..images import FORMATS, available_derivatives, derivative_name, derivative_widths, stored_width
+
+register = template.Library()
+
+
+@register.simple_tag
+def responsive_img(image, alt='', sizes='100vw', **attrs):
+    """Render ``image`` as a <picture> with AVIF/WebP srcsets.
+
+    Falls back to a plain <img> of the original upload until the image has
+    been processed. Extra keyword arguments become <img> attributes.
+    """
+    if not image:
+        return ''
+    sources = []
+    for fmt in FORMATS:
+        variants = available_derivatives(image, fmt)
+        if variants:
+            srcset = ', '.join(f'{url} {width}w' for url, width in variants)
+            sources.append((f'image/{fmt}', srcset))
+    img = format_html(
+        '<img src="{}" alt="{}"{}>',
+        image.url, alt,
+        format_html_join('', ' {}="{}"', sorted(attrs.items())),
+    )
+    if not sources:
+        return img
+    return format_html(
+        '<picture>{}{}</picture>',
+        format_html_join('', '<source type="{}" srcset="{}" sizes="{}">',
+                         ((mime, srcset, sizes) for mime, srcset in sources)),
+        img,
+    )
+
+
+@register.filter
+def derivative_url(image, width):
+    """URL of the ``width`` WebP derivative of ``image``, or of the original."""
+    if not image:
+        return ''
+    width, original_width = int(width), stored_width(image)
+    if original_width and width in derivative_widths(original_width):
+        return image.storage.url(derivative_name(image.name, width, 'webp'))
+    return image.url
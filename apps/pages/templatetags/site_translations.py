@@ -0,0 +1,11 @@
+from django import template
+
+from ..catalog import translate
+
+register = template.Library()
+
+
+@register.simple_tag
+def t(key):
+    """``{% t "nav.home" %}`` — the interface string for ``key`` in the active language."""
+    return translate(key)
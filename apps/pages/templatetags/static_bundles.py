@@ -0,0 +1,23 @@
+from django import template
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from ..assets import bundles
+from ..storage import BundledManifestStaticFilesStorage
+
+register = template.Library()
+
+
+def _tag(path):
+    if path.endswith('.css'):
+        return format_html('<link rel="stylesheet" href="{}">', static(path))
+    return format_html('<script src="{}" defer></script>', static(path))
+
+
+@register.simple_tag
+def bundle(name):
+    """Link a STATIC_BUNDLES entry: the built bundle in production, its sources otherwise."""
+    if isinstance(staticfiles_storage, BundledManifestStaticFilesStorage):
+        return _tag(name)
+    return format_html_join('\n', '{}', ((_tag(path),) for path in bundles()[name]))
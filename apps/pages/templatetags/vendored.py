@@ -0,0 +1,34 @@
+from django import template
+from django.forms.utils import flatatt
+from django.templatetags.static import static
+from django.utils.html import format_html
+
+from ..assets import parse_icon, vendored_manifest
+
+register = template.Library()
+
+
+@register.simple_tag
+def vendored_assets():
+    """``{% vendored_assets as vendor %}`` — the self-hosted asset paths, or None to use the CDNs."""
+    return vendored_manifest()
+
+
+@register.simple_tag
+def icon(classes, **attrs):
+    """``{% icon "fas fa-phone" style="..." %}`` — a Font Awesome icon.
+
+    Once ``vendor_assets`` has run, the icon is drawn from the SVG sprite,
+    so it needs neither the Font Awesome stylesheet nor JavaScript. Until
+    then it is a plain ``<i>`` styled by the CDN stylesheet.
+    """
+    attrs = {'class': classes, **attrs, 'aria-hidden': 'true'}
+    manifest = vendored_manifest()
+    parsed = parse_icon(classes or '')
+    if not manifest or not parsed:
+        return format_html('<i{}></i>', flatatt(attrs))
+    style, name = parsed
+    return format_html(
+        '<i{} data-icon="{}"><svg><use href="{}#{}-{}"></use></svg></i>',
+        flatatt(attrs), name, static(manifest['icon_sprite']), style, name,
+    )
@@ -0,0 +1,911 @@
+import gzip
+import json
+import os
+import runpy
+import shutil
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO, StringIO
+from pathlib import Path
+from unittest import mock, skipUnless
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.db import connection
+from django.http import HttpResponse
+from django.template import Context, Template
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import translation
+from PIL import Image
+
+from apps.pages import urls as page_urls
+from apps.pages.assets import brotli, build_bundle, minify_css, minify_js, parse_icon, precompress, rebase_css_urls
+from apps.pages.benchmarking import page_routes
+from apps.pages.cache import get_homepage_context, page_cache_key
+from apps.pages.catalog import load_catalog
+from apps.pages.counters import recount
+from apps.pages.critical import extract_critical
+from apps.pages.fetch import Fetcher
+from apps.pages.images import FORMATS, available_derivatives, derivative_name, generate_instance_derivatives
+from apps.pages.management.commands.import_news import Command as ImportNewsCommand
+from apps.pages.models import Document, GalleryEvent, GalleryPhoto, ImageTask, News, Program, Statistic, SuccessStory
+from apps.pages.pagination import KeysetPaginator
+from apps.pages.querycheck import QueryInspectorMiddleware, QueryProblemError
+from apps.pages.seeding import ContentSeeder, clear_seeded_content
+from apps.pages.tasks import MAX_ATTEMPTS, claim_next, retry, run
+from apps.pages.views import news_paginator, photo_paginator
+
+
+class FixtureServer:
+    """A local HTTP server answering from ``routes``.
+
+    ``routes`` maps a path to a list of ``(status, content_type, body)``
+    responses, served in order; the last one repeats. A response may carry
+    a fourth item, its ETag, which turns a matching If-None-Match into a
+    304. Every request is recorded as ``(path, monotonic time)`` in
+    ``requests``.
+    """
+
+    def __init__(self, routes):
+        self.routes = {path: list(responses) for path, responses in routes.items()}
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append((self.path, time.monotonic()))
+                responses = server.routes.get(self.path, [(404, 'text/plain', b'not found')])
+                status, content_type, body, *etag = responses.pop(0) if len(responses) > 1 else responses[0]
+                if etag and self.headers.get('If-None-Match') == etag[0]:
+                    status, body = 304, b''
+                self.send_response(status)
+                if etag:
+                    self.send_header('ETag', etag[0])
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.httpd.server_address[1]}'
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def hits(self, path):
+        return [t for p, t in self.requests if p == path]
+
+
+def png_bytes():
+    buf = BytesIO()
+    Image.new('RGB', (40, 30), (200, 30, 30)).save(buf, 'PNG')
+    return buf.getvalue()
+
+
+def list_page(cards):
+    items = ''.join(
+        f'<div class="item"><a href="{url}"><img src="{thumb}"></a>'
+        f'<span class="date">{date}</span><h4>{title}</h4><p>{excerpt}</p></div>'
+        for url, thumb, date, title, excerpt in cards
+    )
+    return f'<html><body><div class="blog-posts">{items}</div></body></html>'.encode()
+
+
+def article_page(paragraph):
+    return (
+        '<html><body><div class="section-blog"><div class="container">'
+        '<h1>Title</h1>'
+        f'<p>{paragraph}</p>'
+        '<ul><li>Point</li></ul>'
+        '<h3>Alte Noutăți</h3><p>Related article</p>'
+        '</div></div></body></html>'
+    ).encode()
+
+
+HTML = 'text/html; charset=utf-8'
+LIST_PATH = '/category/comunicate-de-presa/'
+
+
+class FetcherTests(SimpleTestCase):
+    def test_retries_server_errors(self):
+        routes = {'/flaky': [(503, 'text/plain', b'busy'), (502, 'text/plain', b'busy'), (200, 'text/plain', b'ok')]}
+        with FixtureServer(routes) as server:
+            fetcher = Fetcher(workers=1, rate=0, backoff=0)
+            response = fetcher.get(f'{server.url}/flaky')
+            fetcher.close()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, 'ok')
+        self.assertEqual(len(server.hits('/flaky')), 3)
+
+    def test_gives_up_after_retries(self):
+        with FixtureServer({'/down': [(503, 'text/plain', b'busy')]}) as server:
+            fetcher = Fetcher(workers=1, rate=0, retries=2, backoff=0)
+            response = fetcher.get(f'{server.url}/down')
+            fetcher.close()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(server.hits('/down')), 3)
+
+    def test_rate_limits_per_host(self):
+        routes = {f'/item/{n}': [(200, 'text/plain', b'x')] for n in range(5)}
+        with FixtureServer(routes) as server:
+            fetcher = Fetcher(workers=5, rate=20, backoff=0)
+            fetcher.map(fetcher.get, [f'{server.url}/item/{n}' for n in range(5)])
+            fetcher.close()
+        times = sorted(t for _, t in server.requests)
+        self.assertEqual(len(times), 5)
+        # 20 requests/s: five requests span at least four 50 ms slots
+        self.assertGreaterEqual(times[-1] - times[0], 4 * 0.05 * 0.8)
+
+
+class ImportNewsTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def _run(self, server):
+        out = StringIO()
+        with override_settings(IMPORT_CACHE_DIR=self.tmp, MEDIA_ROOT=self.tmp):
+            call_command('import_news', base_url=server.url, workers=2, rate=0, stdout=out)
+        return out.getvalue()
+
+    def _import(self, routes):
+        with FixtureServer(routes) as server:
+            return self._run(server)
+
+    def _site(self, names, etag=None):
+        """Routes for one list page of articles called ``names``."""
+        routes = {
+            LIST_PATH: [(200, HTML, list_page([
+                (f'/noutati/{name}/', '', '03/15/2024', f'Article {name}', '') for name in names
+            ]), *([etag] if etag else []))],
+        }
+        for name in names:
+            routes[f'/noutati/{name}/'] = [(200, HTML, article_page(name))]
+        return routes
+
+    def test_parses_list_and_article_pages(self):
+        routes = {
+            LIST_PATH: [(200, HTML, list_page([
+                ('/noutati/first/', '/img/first.png', '03/15/2024', 'First article', 'First excerpt'),
+                ('/noutati/second/', '', '01.02.2024', 'Second article', 'Second excerpt'),
+            ]))],
+            '/noutati/first/': [(200, HTML, article_page('First body'))],
+            '/noutati/second/': [(200, HTML, article_page('Second body'))],
+            '/img/first.png': [(200, 'image/png', png_bytes())],
+        }
+        self._import(routes)
+
+        first = News.objects.get(slug='first-article')
+        self.assertEqual(first.excerpt, 'First excerpt')
+        self.assertEqual(first.published_date.isoformat(), '2024-03-15')
+        self.assertIn('<p>First body</p>', first.content)
+        self.assertIn('<li>Point</li>', first.content)
+        self.assertNotIn('Related article', first.content)
+        self.assertTrue(first.image.name.endswith('.png'))
+
+        second = News.objects.get(slug='second-article')
+        self.assertEqual(second.published_date.isoformat(), '2024-02-01')
+        self.assertFalse(second.image)
+
+    def test_skips_duplicate_titles_in_one_run(self):
+        routes = {
+            LIST_PATH: [(200, HTML, list_page([
+                ('/noutati/a/', '', '03/15/2024', 'Same title', ''),
+                ('/noutati/b/', '', '03/14/2024', 'Same title', ''),
+            ]))],
+            '/noutati/a/': [(200, HTML, article_page('A'))],
+            '/noutati/b/': [(200, HTML, article_page('B'))],
+        }
+        output = self._import(routes)
+        self.assertEqual(News.objects.filter(slug='same-title').count(), 1)
+        self.assertIn('Already exists', output)
+
+    def test_retries_throttled_article(self):
+        routes = {
+            LIST_PATH: [(200, HTML, list_page([('/noutati/slow/', '', '03/15/2024', 'Slow article', '')]))],
+            '/noutati/slow/': [(429, 'text/plain', b'slow down'), (200, HTML, article_page('Eventually'))],
+        }
+        self._import(routes)
+        self.assertIn('Eventually', News.objects.get(slug='slow-article').content)
+
+    def test_second_run_stops_at_imported_articles(self):
+        routes = self._site(['a', 'b'])
+        routes[f'{LIST_PATH}page/2/'] = [(200, HTML, list_page([('/noutati/c/', '', '', 'Article c', '')]))]
+        routes['/noutati/c/'] = [(200, HTML, article_page('c'))]
+        with FixtureServer(routes) as server:
+            self._run(server)
+            server.routes.update(self._site(['new', 'a', 'b']))
+            output = self._run(server)
+        self.assertIn('reaches already imported articles', output)
+        self.assertEqual(len(server.hits(f'{LIST_PATH}page/2/')), 1)
+        self.assertEqual(len(server.hits('/noutati/a/')), 1)
+        self.assertTrue(News.objects.filter(slug='article-new').exists())
+
+    def test_unchanged_pages_are_revalidated(self):
+        with FixtureServer(self._site(['a'], etag='"v1"')) as server:
+            first = self._run(server)
+            second = self._run(server)
+        self.assertIn('0 responses served from the conditional cache', first)
+        self.assertIn('1 responses served from the conditional cache', second)
+        self.assertIn('Found 1 articles on page 1', second)
+
+    def test_interrupted_run_resumes(self):
+        names = ['a', 'b', 'c', 'd', 'e']
+        create_news = ImportNewsCommand._create_news
+
+        def interrupted(command, i, *args):
+            # workers=2 writes batches of four, so the first batch is checkpointed
+            if i == 5:
+                raise RuntimeError('interrupted')
+            create_news(command, i, *args)
+
+        with FixtureServer(self._site(names)) as server:
+            with mock.patch.object(ImportNewsCommand, '_create_news', interrupted), \
+                    self.assertRaises(RuntimeError):
+                self._run(server)
+            self.assertEqual(News.objects.count(), 4)
+            output = self._run(server)
+        self.assertIn('Resuming interrupted run: 1 articles left', output)
+        self.assertEqual(len(server.hits(LIST_PATH)), 1)
+        self.assertEqual(News.objects.count(), 5)
+
+
+class PopulateTranslationsTests(TestCase):
+    def setUp(self):
+        Statistic.objects.create(pk=11, key='residents', value='10', label='Rezidenți activi', category='ima')
+
+    def populate(self, **options):
+        out = StringIO()
+        with CaptureQueriesContext(connection) as queries:
+            call_command('populate_translations', stdout=out, **options)
+        updates = [q['sql'] for q in queries if q['sql'].startswith('UPDATE')]
+        return out.getvalue(), updates
+
+    def test_dry_run_reports_without_saving(self):
+        output, updates = self.populate(dry_run=True)
+        self.assertIn("Statistic #11.label_en: None -> 'Active residents'", output)
+        self.assertIn('Dry run, nothing saved.', output)
+        self.assertEqual(updates, [])
+        self.assertIsNone(Statistic.objects.get(pk=11).label_en)
+
+    def test_second_run_writes_nothing(self):
+        output, updates = self.populate()
+        self.assertTrue(any(sql.startswith('UPDATE "pages_statistic"') for sql in updates))
+        self.assertEqual(Statistic.objects.get(pk=11).label_en, 'Active residents')
+        output, updates = self.populate()
+        self.assertRegex(output, r'0 of \d+ Statistic records changed')
+        self.assertEqual(updates, [])
+
+
+class ParseIconTests(SimpleTestCase):
+    def test_style_and_name(self):
+        self.assertEqual(parse_icon('fas fa-phone'), ('solid', 'phone'))
+        self.assertEqual(parse_icon('far fa-calendar-alt'), ('regular', 'calendar-alt'))
+        self.assertEqual(parse_icon('fa-brands fa-telegram-plane'), ('brands', 'telegram-plane'))
+
+    def test_modifiers_and_other_classes_are_ignored(self):
+        self.assertEqual(parse_icon('fas fa-fw fa-spin fa-2x fa-rotate-90 fa-star'), ('solid', 'star'))
+        self.assertEqual(parse_icon('fas fa-star fa-lg'), ('solid', 'star'))
+        self.assertEqual(parse_icon('fas fa-arrow-right leg-item-arrow'), ('solid', 'arrow-right'))
+
+    def test_no_icon(self):
+        self.assertIsNone(parse_icon('fas fa-fw'))
+        self.assertIsNone(parse_icon(''))
+
+
+class MinifyTests(SimpleTestCase):
+    def test_css_drops_comments_and_whitespace_only(self):
+        source = (
+            'a  > b {\n  color: red ;\n  content: " x  y ";\n}\n'
+            '/* dropped */ /*! kept */\n'
+            '@media (max-width: 10px) { a { margin: 0 auto } }'
+        )
+        self.assertEqual(
+            minify_css(source),
+            'a>b{color:red;content:" x  y "}/*! kept */ @media (max-width:10px){a{margin:0 auto}}',
+        )
+
+    def test_js_keeps_line_breaks_and_template_literals(self):
+        source = (
+            '// header\n'
+            'function f() {\n'
+            '    // inner\n'
+            '    return `line\n'
+            '    kept`;\n'
+            '}\n'
+            '\n'
+            'var u = "http://x";\n'
+        )
+        self.assertEqual(minify_js(source), 'function f() {\nreturn `line\n    kept`;\n}\nvar u = "http://x";\n')
+
+    @override_settings(STATIC_BUNDLES={
+        'css/site.css': ['css/main.css', 'css/utilities/switch.css'],
+        'js/site.js': ['js/a.js', 'js/b.js'],
+    })
+    def test_bundles_rebase_urls_and_separate_scripts(self):
+        sources = {
+            'css/main.css': 'a{background:url(../img/a.png)}',
+            'css/utilities/switch.css': 'b{background:url("../../img/b.png")}',
+            'js/a.js': 'var a = 1',
+            'js/b.js': 'var b = 2;',
+        }
+        self.assertEqual(
+            build_bundle('css/site.css', sources.get),
+            'a{background:url(../img/a.png)}\nb{background:url("../img/b.png")}',
+        )
+        self.assertEqual(build_bundle('js/site.js', sources.get), 'var a = 1\n;\nvar b = 2;\n;')
+
+    def test_bundle_tag_links_sources_without_the_bundling_storage(self):
+        html = Template('{% load static_bundles %}{% bundle "js/site.js" %}').render(Context())
+        self.assertHTMLEqual(
+            html,
+            '<script src="/static/js/main.js" defer></script>'
+            '<script src="/static/js/language-switcher.js" defer></script>',
+        )
+
+
+class PrecompressTests(SimpleTestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root)
+        (self.root / 'css').mkdir()
+        self.css = self.root / 'css' / 'site.css'
+        self.css.write_text('a{color:red}\n' * 200)
+
+    def test_writes_smaller_siblings_of_compressible_files(self):
+        (self.root / 'small.js').write_text('var a;')
+        (self.root / 'photo.png').write_bytes(b'x' * 4096)
+        self.assertEqual(precompress(self.root), 1)
+        self.assertEqual(gzip.decompress((self.root / 'css' / 'site.css.gz').read_bytes()), self.css.read_bytes())
+        if brotli is not None:
+            self.assertEqual(brotli.decompress((self.root / 'css' / 'site.css.br').read_bytes()), self.css.read_bytes())
+        self.assertFalse((self.root / 'small.js.gz').exists())
+        self.assertFalse((self.root / 'photo.png.gz').exists())
+
+    def test_unchanged_files_are_skipped_by_digest(self):
+        precompress(self.root)
+        self.assertEqual(precompress(self.root), 0)
+        self.css.write_text('b{color:blue}\n' * 200)
+        self.assertEqual(precompress(self.root), 1)
+        self.assertEqual(gzip.decompress((self.root / 'css' / 'site.css.gz').read_bytes()), self.css.read_bytes())
+        digests = json.loads((self.root / 'precompressed.json').read_text())
+        self.assertEqual(list(digests['files']), ['css/site.css'])
+
+    def test_incompressible_file_loses_its_stale_sibling(self):
+        noise = self.root / 'noise.js'
+        noise.write_bytes(os.urandom(4096))
+        (self.root / 'noise.js.gz').write_bytes(b'stale')
+        precompress(self.root)
+        self.assertFalse((self.root / 'noise.js.gz').exists())
+
+
+class CriticalCssTests(SimpleTestCase):
+    def test_relative_urls_become_absolute(self):
+        html = (
+            '<html><head><link rel="stylesheet" href="/static/css/pages/index.css"></head><body>'
+            '<main><section><div class="programs-grid"><article class="program-card"></article></div></section></main>'
+            '</body></html>'
+        )
+        css = extract_critical(html)
+        self.assertIn('url("/static/img/programeducatieantreprenoriala.webp")', css)
+        self.assertNotIn('../', css)
+
+    def test_rebase_keeps_absolute_and_data_urls(self):
+        css = (
+            'a{background:url(/static/x.png)}'
+            'b{background:url("data:image/svg+xml,%3Crect filter=\'url(%23n)\'/%3E")}'
+            'c{background:url(../i.png)}'
+        )
+        self.assertEqual(
+            rebase_css_urls(css, 'https://cdn.example/static/css/a.css'),
+            css.replace('../i.png', 'https://cdn.example/static/i.png'),
+        )
+
+
+def use_temp_media(test):
+    """Point MEDIA_ROOT at a directory removed when ``test`` ends."""
+    media = tempfile.mkdtemp()
+    test.addCleanup(shutil.rmtree, media)
+    settings_override = override_settings(MEDIA_ROOT=media)
+    settings_override.enable()
+    test.addCleanup(settings_override.disable)
+
+
+def image_bytes(width, fmt='JPEG'):
+    buf = BytesIO()
+    Image.new('RGB', (width, width // 2), (30, 64, 175)).save(buf, fmt)
+    return buf.getvalue()
+
+
+class DerivativeTests(TestCase):
+    def setUp(self):
+        use_temp_media(self)
+
+    def upload(self, name, width, fmt):
+        field = News._meta.get_field('image')
+        news = News.objects.create(
+            title=name, content='x', published_date='2024-01-01',
+            image=field.storage.save(name, ContentFile(image_bytes(width, fmt))),
+        )
+        generate_instance_derivatives(news)
+        return news
+
+    def test_extension_is_kept(self):
+        self.assertNotEqual(derivative_name('news/foo.jpg', 480, 'webp'), derivative_name('news/foo.png', 480, 'webp'))
+
+    def test_original_width_is_largest_candidate(self):
+        news = self.upload('news/wide.jpg', 1000, 'JPEG')
+        for fmt in FORMATS:
+            widths = [width for url, width in available_derivatives(news.image, fmt)]
+            self.assertEqual(widths, [480, 800, 1000])
+
+    def test_narrow_original_gets_one_candidate(self):
+        news = self.upload('news/narrow.png', 300, 'PNG')
+        for fmt in FORMATS:
+            self.assertEqual([width for url, width in available_derivatives(news.image, fmt)], [300])
+
+    def test_size_is_recorded(self):
+        news = self.upload('news/wide.jpg', 1000, 'JPEG')
+        self.assertEqual(News.objects.values_list('image_width', 'image_height').get(pk=news.pk), (1000, 500))
+
+    def test_render_does_not_touch_storage(self):
+        news = News.objects.get(pk=self.upload('news/wide.jpg', 1000, 'JPEG').pk)
+        storage = news.image.storage
+        with mock.patch.object(storage, 'exists') as exists, mock.patch.object(storage, 'open') as open_:
+            html = Template('{% load responsive_images %}{% responsive_img news.image "x" %}').render(
+                Context({'news': news})
+            )
+        exists.assert_not_called()
+        open_.assert_not_called()
+        self.assertIn('wide-jpg-800w.webp 800w', html)
+
+    def test_unprocessed_image_falls_back_to_original(self):
+        news = self.upload('news/wide.jpg', 1000, 'JPEG')
+        News.objects.filter(pk=news.pk).update(image_width=None, image_height=None)
+        news.refresh_from_db()
+        self.assertEqual(available_derivatives(news.image, 'webp'), [])
+
+
+class ImageTaskTests(TestCase):
+    def setUp(self):
+        use_temp_media(self)
+        self.event = GalleryEvent.objects.create(slug='queued', title='Queued', event_date='2026-01-01')
+
+    def upload(self):
+        photo = GalleryPhoto(event=self.event)
+        photo.image.save('queued.jpg', ContentFile(image_bytes(900)), save=False)
+        photo.save()
+        return photo
+
+    def test_upload_is_queued_not_processed(self):
+        photo = self.upload()
+        task = ImageTask.objects.get()
+        self.assertEqual((task.model_label, task.object_id, task.status), ('pages.galleryphoto', photo.pk, 'pending'))
+        photo.refresh_from_db()
+        self.assertEqual(photo.processing_status, 'pending')
+        self.assertIsNone(photo.image_width)
+
+    def test_worker_processes_the_task(self):
+        photo = self.upload()
+        call_command('process_image_tasks', once=True, stdout=StringIO())
+        self.assertEqual(ImageTask.objects.get().status, 'done')
+        photo.refresh_from_db()
+        self.assertEqual((photo.processing_status, photo.image_width), ('done', 900))
+        self.assertEqual([width for url, width in available_derivatives(photo.image, 'webp')], [480, 800, 900])
+
+    def test_failures_are_retried_then_given_up(self):
+        self.upload()
+        with mock.patch('apps.pages.tasks.process_instance_images', side_effect=OSError('broken')):
+            for attempt in range(1, MAX_ATTEMPTS + 1):
+                task = claim_next()
+                self.assertEqual(task.attempts, attempt)
+                run(task)
+        self.assertEqual((task.status, task.error), ('failed', 'broken'))
+        self.assertIsNone(claim_next())
+        self.assertEqual(GalleryPhoto.objects.get().processing_status, 'failed')
+
+        retry(ImageTask.objects.all())
+        task = ImageTask.objects.get()
+        self.assertEqual((task.status, task.attempts, task.error), ('pending', 0, ''))
+        self.assertEqual(GalleryPhoto.objects.get().processing_status, 'pending')
+        self.assertEqual(claim_next(), task)
+
+
+class HomepageCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def homepage(self, lang):
+        with translation.override(lang):
+            return get_homepage_context()
+
+    def test_context_is_cached_per_language(self):
+        self.homepage('ro')
+        with self.assertNumQueries(0):
+            self.homepage('ro')
+        with CaptureQueriesContext(connection) as queries:
+            self.homepage('en')
+        self.assertTrue(queries)
+
+    def test_save_and_delete_invalidate_every_language(self):
+        self.homepage('ro')
+        self.homepage('en')
+        news = News.objects.create(title='Fresh', content='x', published_date='2026-01-01')
+        for lang in ('ro', 'en'):
+            self.assertEqual(self.homepage(lang)['latest_news'], [news])
+        news.delete()
+        for lang in ('ro', 'en'):
+            self.assertEqual(self.homepage(lang)['latest_news'], [])
+
+
+class CatalogTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        catalogs = {
+            'ro': {'nav': {'home': 'Acasă', 'apply': 'Aplică'}},
+            'en': {'nav': {'home': 'Home'}},
+        }
+        for lang, catalog in catalogs.items():
+            with open(f'{directory}/{lang}.json', 'w', encoding='utf-8') as fh:
+                json.dump(catalog, fh)
+        patcher = mock.patch('apps.pages.catalog.CATALOG_DIR', Path(directory))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        load_catalog.cache_clear()
+        self.addCleanup(load_catalog.cache_clear)
+
+    def render(self, key, lang):
+        with translation.override(lang):
+            return Template('{% load site_translations %}{% t key %}').render(Context({'key': key}))
+
+    def test_active_language(self):
+        self.assertEqual(self.render('nav.home', 'ro'), 'Acasă')
+        self.assertEqual(self.render('nav.home', 'en'), 'Home')
+
+    def test_missing_translation_falls_back_to_default_language(self):
+        self.assertEqual(self.render('nav.apply', 'en'), 'Aplică')
+        self.assertEqual(self.render('nav.apply', 'uk'), 'Aplică')
+
+    def test_unknown_or_partial_key_renders_nothing(self):
+        self.assertEqual(self.render('nav.missing', 'en'), '')
+        self.assertEqual(self.render('nav', 'en'), '')
+
+
+@override_settings(PAGES_FULL_PAGE_CACHE=False)
+class DocumentListingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for category, _ in Document.CATEGORY_CHOICES:
+            for order in range(3):
+                Document.objects.create(title=f'{category} {order}', category=category, order=order,
+                                        file=f'documents/{category}-{order}.pdf')
+
+    def setUp(self):
+        cache.clear()
+
+    def document_queries(self, path):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        return [q['sql'] for q in queries if 'pages_document' in q['sql']], response
+
+    def test_transparency_pages_share_one_query(self):
+        queries, response = self.document_queries('/planuri/')
+        self.assertEqual(len(queries), 1)
+        orders = [document.order for document in response.context['rapoarte'] if document.title.startswith('rapoarte')]
+        self.assertEqual(orders, [2, 1, 0])
+        for path in ('/rapoarte/', '/achizitii/'):
+            with self.subTest(path=path):
+                self.assertEqual(self.document_queries(path)[0], [])
+
+    def test_saving_a_document_refreshes_the_listing(self):
+        self.document_queries('/achizitii/')
+        Document.objects.create(title='New notice', category='achizitii_anunturi', file='documents/new.pdf')
+        queries, response = self.document_queries('/achizitii/')
+        self.assertEqual(len(queries), 1)
+        self.assertContains(response, 'New notice')
+
+
+class PageCacheKeyTests(SimpleTestCase):
+    def key(self, url, params=()):
+        request = RequestFactory().get(url)
+        request.user = AnonymousUser()
+        return page_cache_key(request, (), params)
+
+    def test_unread_params_share_the_page(self):
+        self.assertEqual(self.key('/comunicate/'), self.key('/comunicate/?utm_source=fb&fbclid=x'))
+
+    def test_read_params_vary_the_page(self):
+        params = ('after',)
+        self.assertNotEqual(self.key('/comunicate/', params), self.key('/comunicate/?after=abc', params))
+        self.assertEqual(self.key('/comunicate/?after=abc', params), self.key('/comunicate/?utm_source=x&after=abc', params))
+
+
+def listing_queries(client, path, models):
+    """The SELECTs from the tables of ``models`` run while rendering ``path``."""
+    tables = [f'FROM "{model._meta.db_table}"' for model in models]
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(path)
+    assert response.status_code == 200, f'{path}: HTTP {response.status_code}'
+    return [
+        query['sql'] for query in queries.captured_queries
+        if query['sql'].startswith('SELECT') and any(table in query['sql'] for table in tables)
+    ]
+
+
+def result_bytes(sql, params=None):
+    """``(bytes, rows)`` returned by ``sql``, counting each value as UTF-8 text."""
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    return sum(len(str(value).encode()) for row in rows for value in row if value is not None), len(rows)
+
+
+@override_settings(PAGES_FULL_PAGE_CACHE=False)
+class ListingBytesTests(TestCase):
+    """Listing pages must not fetch the HTML bodies for_listing() defers."""
+
+    # A full row with 30 paragraphs per language is ~30 KB
+    MAX_BYTES_PER_ROW = 4096
+    PAGES = ('/', '/comunicate/', '/istorii-de-succes/')
+
+    @classmethod
+    def setUpTestData(cls):
+        seeder = ContentSeeder(paragraphs=30)
+        seeder.news(40)
+        seeder.supporting(20)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_full_rows_exceed_the_budget(self):
+        sql, params = News.objects.all().query.sql_with_params()
+        size, rows = result_bytes(sql, params)
+        self.assertGreater(size / rows, self.MAX_BYTES_PER_ROW)
+
+    def test_listing_pages_stay_within_the_budget(self):
+        for path in self.PAGES:
+            with self.subTest(path=path):
+                checked = 0
+                for sql in listing_queries(self.client, path, (News, SuccessStory, Program)):
+                    size, rows = result_bytes(sql)
+                    if rows:
+                        checked += 1
+                        self.assertLessEqual(size / rows, self.MAX_BYTES_PER_ROW, sql)
+                self.assertTrue(checked, 'no listing query ran')
+
+
+class KeysetPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Three articles per day, so pages break inside runs of equal dates
+        ContentSeeder(paragraphs=1).news(3000)
+
+    def test_pages_cover_the_listing_in_order(self):
+        paginator = KeysetPaginator(news_paginator.ordering, 70)
+        seen, cursor = [], None
+        while True:
+            objects, cursor = paginator.page(News.objects.all(), cursor)
+            seen += [obj.pk for obj in objects]
+            if cursor is None:
+                break
+        self.assertEqual(seen, list(News.objects.order_by(*news_paginator.ordering).values_list('pk', flat=True)))
+
+    def test_photos_with_equal_order_come_newest_first(self):
+        event = GalleryEvent.objects.create(slug='bulk', title='Bulk', event_date='2026-01-01')
+        photos = [GalleryPhoto.objects.create(event=event, image=f'gallery/{i}.webp') for i in range(5)]
+        paginator = KeysetPaginator(photo_paginator.ordering, 2)
+        first, cursor = paginator.page(event.photos.all())
+        second, _ = paginator.page(event.photos.all(), cursor)
+        self.assertEqual([p.pk for p in first + second], [p.pk for p in reversed(photos)][:4])
+
+    @skipUnless(connection.vendor == 'sqlite', 'SQLite plan wording')
+    def test_deep_cursor_range_searches_the_index(self):
+        deep = news_paginator.rows_after(News.objects.all())[2500]
+        queryset = news_paginator.rows_after(News.objects.for_listing(), news_paginator.encode(deep))
+        plan = queryset[:news_paginator.page_size + 1].explain()
+        self.assertIn('SEARCH pages_news USING INDEX news_published_id_idx (published_date<?)', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+
+
+class PageRoutesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seeder = ContentSeeder(paragraphs=1)
+        seeder.news(3, images_per_news=1)
+        seeder.gallery(2, photos_per_event=3)
+        seeder.supporting(2)
+
+    def test_every_route_resolves_and_renders(self):
+        routes = dict(page_routes())
+        self.assertEqual(set(routes), {pattern.name for pattern in page_urls.urlpatterns})
+        self.assertEqual(routes['gallery-photos'], '/galerie/seed-event-0/photos/')
+        for name, path in routes.items():
+            with self.subTest(name=name):
+                self.assertEqual(self.client.get(path).status_code, 200)
+
+
+@override_settings(PAGES_QUERY_INSPECTOR='raise')
+class QueryInspectorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # More rows than PAGES_QUERY_REPEAT_THRESHOLD, so a per-row query would show
+        seeder = ContentSeeder(paragraphs=1)
+        seeder.news(8, images_per_news=2)
+        seeder.gallery(8, photos_per_event=8)
+        seeder.supporting(8)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_n_plus_one_view_raises(self):
+        def view(request):
+            return HttpResponse(', '.join(photo.event.title for photo in GalleryPhoto.objects.all()))
+
+        middleware = QueryInspectorMiddleware(view)
+        with self.assertLogs('apps.pages.queries', 'WARNING'), self.assertRaises(QueryProblemError) as raised:
+            middleware(RequestFactory().get('/galerie/'))
+        self.assertIn('repeated', str(raised.exception))
+
+    def test_every_route_passes(self):
+        for name, path in page_routes():
+            with self.subTest(name=name):
+                self.assertEqual(self.client.get(path).status_code, 200)
+
+    @override_settings(PAGES_QUERY_INSPECTOR='')
+    def test_disabled_without_setting(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            QueryInspectorMiddleware(lambda request: HttpResponse())
+
+
+class CounterSignalTests(TestCase):
+    def setUp(self):
+        self.event = GalleryEvent.objects.create(slug='counted', title='Counted', event_date='2026-01-01')
+        self.photos = [GalleryPhoto.objects.create(event=self.event, image=f'gallery/{i}.webp') for i in range(5)]
+
+    def test_delete_recounts_each_parent_once_after_commit(self):
+        doomed = GalleryPhoto.objects.filter(pk__in=[photo.pk for photo in self.photos[:3]])
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            doomed.delete()
+        updates = [q for q in queries.captured_queries if q['sql'].startswith('UPDATE "pages_galleryevent"')]
+        self.assertEqual(len(updates), 1)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.photo_count, 2)
+
+    def test_save_counts_new_and_moved_children(self):
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.photo_count, 5)
+        other = GalleryEvent.objects.create(slug='other', title='Other', event_date='2026-01-02')
+        moved = self.photos[0]
+        moved.event = other
+        moved.save()
+        self.assertEqual(GalleryEvent.objects.get(pk=self.event.pk).photo_count, 4)
+        self.assertEqual(GalleryEvent.objects.get(pk=other.pk).photo_count, 1)
+
+    def test_recount_fixes_drift(self):
+        GalleryEvent.objects.filter(pk=self.event.pk).update(photo_count=9)
+        out = StringIO()
+        call_command('recount', stdout=out)
+        self.assertIn('1 fixed', out.getvalue())
+        self.assertEqual(GalleryEvent.objects.get(pk=self.event.pk).photo_count, 5)
+        self.assertEqual(recount(), {GalleryEvent: 0, News: 0})
+
+
+class ProductionDatabaseSettingsTests(SimpleTestCase):
+    def database(self, **env):
+        environ = {key: value for key, value in os.environ.items() if not key.startswith('DB_')}
+        with mock.patch.dict(os.environ, {**environ, **env}, clear=True):
+            return runpy.run_module('config.settings.production')['DATABASES']['default']
+
+    def test_persistent_health_checked_connections_by_default(self):
+        database = self.database()
+        self.assertEqual((database['CONN_MAX_AGE'], database['CONN_HEALTH_CHECKS']), (60, True))
+        self.assertNotIn('OPTIONS', database)
+
+    def test_environment_overrides(self):
+        database = self.database(DB_CONN_MAX_AGE='300', DB_CONN_HEALTH_CHECKS='0', DB_HOST='db', DB_PORT='6432')
+        self.assertEqual((database['CONN_MAX_AGE'], database['CONN_HEALTH_CHECKS']), (300, False))
+        self.assertEqual((database['HOST'], database['PORT']), ('db', '6432'))
+
+    def test_pool_replaces_persistent_connections(self):
+        database = self.database(DB_POOL='1', DB_POOL_MAX_SIZE='4', DB_POOL_TIMEOUT='2.5')
+        self.assertEqual(database['CONN_MAX_AGE'], 0)
+        self.assertEqual(database['OPTIONS']['pool'], {'min_size': 1, 'max_size': 4, 'timeout': 2.5})
+
+
+class SeedScaleTests(TestCase):
+    def test_seed_and_clear(self):
+        out = StringIO()
+        call_command('seed_scale', news=30, images_per_news=2, events=3, photos_per_event=4, documents=5,
+                     supporting=2, stdout=out)
+        self.assertEqual(News.objects.filter(image_count=2).count(), 30)
+        self.assertEqual(GalleryPhoto.objects.count(), 12)
+
+        with CaptureQueriesContext(connection) as queries:
+            call_command('seed_scale', clear=True, stdout=out)
+        self.assertIn('Deleted', out.getvalue())
+        self.assertFalse(News.objects.exists() or GalleryEvent.objects.exists())
+        # One statement per table, not one per deleted row
+        self.assertLess(len(queries), 60)
+
+    def test_receivers_are_reconnected_after_clearing(self):
+        ContentSeeder(paragraphs=1).gallery(1, photos_per_event=2)
+        clear_seeded_content()
+        event = GalleryEvent.objects.create(slug='kept', title='Kept', event_date='2026-01-01')
+        GalleryPhoto.objects.create(event=event, image='gallery/kept.webp')
+        event.refresh_from_db()
+        self.assertEqual(event.photo_count, 1)
+
+
+def plan_nodes(plan):
+    yield plan
+    for child in plan.get('Plans', ()):
+        yield from plan_nodes(child)
+
+
+@skipUnless(connection.vendor == 'postgresql', 'EXPLAIN plans are checked on PostgreSQL only')
+@override_settings(PAGES_FULL_PAGE_CACHE=False)
+class ListingPlanTests(TestCase):
+    """Paginated listings, first and deep pages, must read an index range.
+
+    Unbounded listings read every row either way, so only queries with a
+    LIMIT are checked.
+    """
+
+    MODELS = (News, GalleryEvent, GalleryPhoto)
+
+    @classmethod
+    def setUpTestData(cls):
+        seeder = ContentSeeder(paragraphs=1)
+        seeder.news(10000)
+        seeder.gallery(200, photos_per_event=50)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def setUp(self):
+        cache.clear()
+
+    def pages(self):
+        """First pages, then pages behind a cursor deep into each listing."""
+        news = news_paginator.rows_after(News.objects.all())[8000]
+        event = GalleryEvent.objects.get(slug='seed-event-0')
+        photo = photo_paginator.rows_after(event.photos.all())[40]
+        return (
+            '/', '/comunicate/', '/galerie/seed-event-0/', '/galerie/seed-event-0/photos/',
+            f'/comunicate/more/?after={news_paginator.encode(news)}',
+            f'/galerie/seed-event-0/photos/?after={photo_paginator.encode(photo)}',
+        )
+
+    def test_paginated_listings_use_an_index(self):
+        checked = 0
+        for path in self.pages():
+            for sql in listing_queries(self.client, path, self.MODELS):
+                if ' LIMIT ' not in sql:
+                    continue
+                with connection.cursor() as cursor:
+                    cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}')
+                    plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                nodes = [node['Node Type'] for node in plan_nodes(plan[0]['Plan'])]
+                checked += 1
+                with self.subTest(path=path, sql=sql):
+                    self.assertNotIn('Seq Scan', nodes, ' > '.join(nodes))
+                    self.assertNotIn('Sort', nodes, ' > '.join(nodes))
+        self.assertTrue(checked, 'no paginated listing query ran')
@@ -11,9 +11,11 @@ urlpatterns = [
     path('contacte/', views.ContacteView.as_view(), name='contacte'),
     path('galerie/', views.GalerieView.as_view(), name='galerie'),
     path('galerie/<slug:slug>/', views.GalleryEventDetailView.as_view(), name='gallery-event'),
+    path('galerie/<slug:slug>/photos/', views.GalleryPhotosView.as_view(), name='gallery-photos'),
     path('istorii-de-succes/', views.IstoriiView.as_view(), name='istorii-de-succes'),
     path('istorii-de-succes/<slug:slug>/', views.SuccessStoryDetailView.as_view(), name='story-detail'),
     path('parteneri/', views.ParteneriView.as_view(), name='parteneri'),
+    path('comunicate/more/', views.ComunicateMoreView.as_view(), name='comunicate-more'),
     path('comunicate/<slug:slug>/', views.NewsDetailView.as_view(), name='news-detail'),
     path('comunicate/', views.ComunicateView.as_view(), name='comunicate'),
     path('planuri/', views.PlanuriView.as_view(), name='planuri'),
@@ -1,11 +1,46 @@
-from django.db.models import Count
+from django.conf import settings
+from django.http import Http404, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.template.loader import render_to_string
+from django.views import View
 from django.views.generic import TemplateView, DetailView
+from .cache import get_cached_page, get_document_listings, get_homepage_context, page_cache_key, store_page
+from .pagination import KeysetPaginator
 from .models import SuccessStory, Partner, EUProject, GalleryEvent, GalleryPhoto, Program, Statistic, Mentor, News, Document
 
+NEWS_PAGE_SIZE = 12
+
+news_paginator = KeysetPaginator(('-published_date', '-id'), NEWS_PAGE_SIZE)
+
+GALLERY_PAGE_SIZE = 24
+
+photo_paginator = KeysetPaginator(('order', '-id'), GALLERY_PAGE_SIZE)
+
 
 class PageView(TemplateView):
-    """Base view for all pages. Provides active_page context for nav highlighting."""
+    """Base view for all pages. Provides active_page context for nav highlighting.
+
+    Views that set ``cache_page`` are served from the full-page cache, which is
+    purged whenever one of their ``cache_models`` is saved or deleted. Only the
+    query parameters in ``cache_params`` vary the cached page; others (e.g.
+    utm_* tags) share it.
+    """
     active_page = ''
+    cache_page = False
+    cache_models = ()
+    cache_params = ()
+
+    def dispatch(self, request, *args, **kwargs):
+        use_cache = self.cache_page and settings.PAGES_FULL_PAGE_CACHE and request.method in ('GET', 'HEAD')
+        if not use_cache:
+            return super().dispatch(request, *args, **kwargs)
+        key = page_cache_key(request, self.cache_models, self.cache_params)
+        response = get_cached_page(key)
+        if response is None:
+            response = super().dispatch(request, *args, **kwargs)
+            if hasattr(response, 'add_post_render_callback'):
+                response.add_post_render_callback(lambda r: store_page(request, key, r))
+        return response
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -16,30 +51,30 @@ class PageView(TemplateView):
 class IndexView(PageView):
     template_name = 'pages/index.html'
     active_page = 'index'
+    cache_page = True
+    cache_models = (SuccessStory, Partner, Program, Statistic, News)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['featured_stories'] = SuccessStory.objects.filter(is_featured=True)
-        context['all_stories'] = SuccessStory.objects.all()
-        context['partners'] = Partner.objects.filter(is_active=True)
-        context['programs'] = Program.objects.all()
-        context['stats'] = {s.key: s for s in Statistic.objects.all()}
-        context['latest_news'] = News.objects.all()[:5]
+        context.update(get_homepage_context())
         return context
 
 
 class DespreView(PageView):
     template_name = 'pages/despre.html'
     active_page = 'despre'
+    cache_page = True
 
 
 class ProgrameView(PageView):
     template_name = 'pages/programe.html'
     active_page = 'programe'
+    cache_page = True
+    cache_models = (Program, Statistic, Mentor)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['programs'] = Program.objects.all()
+        context['programs'] = Program.objects.for_listing()
         context['stats'] = {s.key: s for s in Statistic.objects.filter(category='programs')}
         context['mentors'] = Mentor.objects.filter(is_active=True)
         return context
@@ -48,6 +83,8 @@ class ProgrameView(PageView):
 class ImaView(PageView):
     template_name = 'pages/ima.html'
     active_page = 'ima'
+    cache_page = True
+    cache_models = (Statistic,)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -63,10 +100,12 @@ class ContacteView(PageView):
 class GalerieView(PageView):
     template_name = 'pages/galerie.html'
     active_page = 'galerie'
+    cache_page = True
+    cache_models = (GalleryEvent, GalleryPhoto)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['events'] = GalleryEvent.objects.annotate(photo_count=Count('photos'))
+        context['events'] = GalleryEvent.objects.all()
         return context
 
 
@@ -75,23 +114,40 @@ class GalleryEventDetailView(DetailView):
     template_name = 'pages/galerie_event.html'
     context_object_name = 'event'
 
-    def get_queryset(self):
-        return super().get_queryset().prefetch_related('photos')
-
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['active_page'] = 'galerie'
-        context['photos'] = self.object.photos.all()
+        context['photos'], context['next_cursor'] = photo_page(self.request, self.object)
         return context
 
 
+def photo_page(request, event):
+    """One keyset page of an event's photos, starting after the ``after`` query parameter."""
+    try:
+        return photo_paginator.page(event.photos.all(), request.GET.get('after'))
+    except ValueError:
+        raise Http404('Invalid cursor')
+
+
+class GalleryPhotosView(View):
+    """Next page of an event's photos as an HTML fragment, for the grid and the lightbox."""
+
+    def get(self, request, slug):
+        event = get_object_or_404(GalleryEvent, slug=slug)
+        photos, next_cursor = photo_page(request, event)
+        html = render_to_string('partials/_gallery_photos.html', {'photos': photos, 'event': event}, request=request)
+        return JsonResponse({'html': html, 'next_cursor': next_cursor})
+
+
 class IstoriiView(PageView):
     template_name = 'pages/istorii-de-succes.html'
     active_page = 'istorii-de-succes'
+    cache_page = True
+    cache_models = (SuccessStory,)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['stories'] = SuccessStory.objects.all()
+        context['stories'] = SuccessStory.objects.for_listing()
         return context
 
 
@@ -109,6 +165,8 @@ class SuccessStoryDetailView(DetailView):
 class ParteneriView(PageView):
     template_name = 'pages/parteneri.html'
     active_page = 'parteneri'
+    cache_page = True
+    cache_models = (Partner, EUProject, Statistic)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -121,13 +179,33 @@ class ParteneriView(PageView):
 class ComunicateView(PageView):
     template_name = 'pages/comunicate.html'
     active_page = 'comunicate'
+    cache_page = True
+    cache_models = (News,)
+    cache_params = ('after',)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['news'] = News.objects.all()
+        context['news'], context['next_cursor'] = news_page(self.request)
         return context
 
 
+def news_page(request):
+    """One keyset page of news, starting after the ``after`` query parameter."""
+    try:
+        return news_paginator.page(News.objects.for_listing(), request.GET.get('after'))
+    except ValueError:
+        raise Http404('Invalid cursor')
+
+
+class ComunicateMoreView(View):
+    """Next page of news cards as an HTML fragment, for the "load more" button."""
+
+    def get(self, request):
+        news, next_cursor = news_page(request)
+        html = render_to_string('partials/_news_cards.html', {'news': news}, request=request)
+        return JsonResponse({'html': html, 'next_cursor': next_cursor})
+
+
 class NewsDetailView(DetailView):
     model = News
     template_name = 'pages/news_detail.html'
@@ -143,78 +221,87 @@ class NewsDetailView(DetailView):
         return context
 
 
-class PlanuriView(PageView):
-    template_name = 'pages/planuri.html'
-    active_page = 'planuri'
+class DocumentListView(PageView):
+    """Transparency page listing documents grouped by category.
+
+    ``document_sections`` maps each context variable to a Document category.
+    """
+    cache_page = True
+    cache_models = (Document,)
+    document_sections = {}
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['planuri'] = Document.objects.filter(category='planuri').order_by('-order')
-        context['rapoarte'] = Document.objects.filter(category='rapoarte').order_by('-order')
-        context['declaratii'] = Document.objects.filter(category='declaratii').order_by('-order')
+        listings = get_document_listings()
+        for name, category in self.document_sections.items():
+            context[name] = listings[category]
         return context
 
 
-class RapoarteView(PageView):
+class PlanuriView(DocumentListView):
     template_name = 'pages/planuri.html'
     active_page = 'planuri'
+    document_sections = {'planuri': 'planuri', 'rapoarte': 'rapoarte', 'declaratii': 'declaratii'}
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['planuri'] = Document.objects.filter(category='planuri').order_by('-order')
-        context['rapoarte'] = Document.objects.filter(category='rapoarte').order_by('-order')
-        context['declaratii'] = Document.objects.filter(category='declaratii').order_by('-order')
-        return context
 
+class RapoarteView(PlanuriView):
+    """/rapoarte/ shows the same page as /planuri/."""
 
-class AchizitiiView(PageView):
+
+class AchizitiiView(DocumentListView):
     template_name = 'pages/achizitii.html'
     active_page = 'achizitii'
-
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['planuri'] = Document.objects.filter(category='achizitii_planuri').order_by('-order')
-        context['anunturi'] = Document.objects.filter(category='achizitii_anunturi').order_by('-order')
-        context['rapoarte'] = Document.objects.filter(category='achizitii_rapoarte').order_by('-order')
-        return context
+    document_sections = {
+        'planuri': 'achizitii_planuri',
+        'anunturi': 'achizitii_anunturi',
+        'rapoarte': 'achizitii_rapoarte',
+    }
 
 
 class CarieraView(PageView):
     template_name = 'pages/cariera.html'
     active_page = 'cariera'
+    cache_page = True
 
 
 class DeplasariView(PageView):
     template_name = 'pages/deplasari.html'
     active_page = 'deplasari'
+    cache_page = True
 
 
 class ProtectiaDatelorView(PageView):
     template_name = 'pages/protectia-datelor.html'
     active_page = 'protectia-datelor'
+    cache_page = True
 
 
 
 class StructuraView(PageView):
     template_name = 'pages/structura.html'
     active_page = 'structura'
+    cache_page = True
 
 
 class EchipaView(PageView):
     template_name = 'pages/echipa.html'
     active_page = 'echipa'
+    cache_page = True
 
 
 class BugetView(PageView):
     template_name = 'pages/buget.html'
     active_page = 'buget'
+    cache_page = True
 
 
 class ProiecteView(PageView):
     template_name = 'pages/proiecte.html'
     active_page = 'proiecte'
+    cache_page = True
 
 
 class LegislatieView(PageView):
     template_name = 'pages/legislatie.html'
     active_page = 'legislatie'
+    cache_page = True
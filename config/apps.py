@@ -0,0 +1,7 @@
+from django.contrib.staticfiles.apps import StaticFilesConfig
+
+
+class CMDAStaticFilesConfig(StaticFilesConfig):
+    # The translation catalogs are read by apps.pages.catalog on the server
+    # and never requested by the browser, so collectstatic leaves them out
+    ignore_patterns = StaticFilesConfig.ignore_patterns + ['js/translations/*']
@@ -15,12 +15,14 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
-    'django.contrib.staticfiles',
+    'config.apps.CMDAStaticFilesConfig',
     'apps.pages',
     'apps.contact',
 ]
 
 MIDDLEWARE = [
+    'apps.pages.querycheck.QueryInspectorMiddleware',
+    'apps.pages.middleware.ServerTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',
@@ -79,7 +81,59 @@ STATIC_URL = '/static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+# Assets concatenated into one file by the production static storage;
+# templates link them with {% bundle %}
+STATIC_BUNDLES = {
+    'css/site.css': ['css/main.css', 'css/utilities/language-switcher.css'],
+    'js/site.js': ['js/main.js', 'js/language-switcher.js'],
+}
+
+# Per-page above-the-fold CSS written by `manage.py build_critical_css`
+CRITICAL_CSS_DIR = Path(os.environ.get('CRITICAL_CSS_DIR', BASE_DIR / 'var' / 'critical_css'))
+
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# HTTP cache and checkpoints of the import commands
+IMPORT_CACHE_DIR = Path(os.environ.get('IMPORT_CACHE_DIR', BASE_DIR / 'var' / 'import_cache'))
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'cmda',
+    }
+}
+
+PAGES_CACHE_TIMEOUT = int(os.environ.get('PAGES_CACHE_TIMEOUT', 60 * 60))
+PAGES_FULL_PAGE_CACHE = os.environ.get('PAGES_FULL_PAGE_CACHE', '1') != '0'
+
+# N+1 and slow-query detection (apps/pages/querycheck.py): '' (off), 'log'
+# or 'raise' to turn problems into server errors in development and CI
+PAGES_QUERY_INSPECTOR = os.environ.get('PAGES_QUERY_INSPECTOR', '')
+PAGES_QUERY_REPEAT_THRESHOLD = int(os.environ.get('PAGES_QUERY_REPEAT_THRESHOLD', 5))
+PAGES_SLOW_QUERY_MS = float(os.environ.get('PAGES_SLOW_QUERY_MS', 100))
+
+# The query inspector's warnings go to stderr (the gunicorn error log in
+# production); ServerTimingMiddleware's per-request lines too, once
+# PAGES_TIMING_LOG_LEVEL=DEBUG
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'stderr': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'apps.pages.timing': {
+            'handlers': ['stderr'],
+            'level': os.environ.get('PAGES_TIMING_LOG_LEVEL', 'WARNING'),
+            'propagate': False,
+        },
+        'apps.pages.queries': {
+            'handlers': ['stderr'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
+}
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
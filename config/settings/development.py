@@ -9,3 +9,6 @@ DATABASES = {
         'NAME': BASE_DIR / 'db.sqlite3',
     }
 }
+
+# Template edits should show up without purging the full-page cache
+PAGES_FULL_PAGE_CACHE = False
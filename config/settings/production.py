@@ -12,6 +12,31 @@ DATABASES = {
         'PASSWORD': os.environ.get('DB_PASSWORD'),
         'HOST': os.environ.get('DB_HOST', 'localhost'),
         'PORT': os.environ.get('DB_PORT', '5432'),
+        # Reuse each worker's connection across requests instead of paying
+        # TCP + auth on every one; checked before reuse so a restarted
+        # Postgres costs one reconnect, not a 500
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': os.environ.get('DB_CONN_HEALTH_CHECKS', '1') != '0',
+    }
+}
+
+# Optional connection pool instead of persistent connections. Needs psycopg 3
+# (pip install "psycopg[binary,pool]"); each gunicorn worker gets its own pool
+if os.environ.get('DB_POOL', '0') != '0':
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 1)),
+            'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 2)),
+            'timeout': float(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        },
+    }
+
+# Shared between gunicorn workers so signal-based invalidation reaches all of them
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('CACHE_DIR', '/var/tmp/cmda/cache'),
     }
 }
 
@@ -31,6 +56,6 @@ STORAGES = {
         'BACKEND': 'django.core.files.storage.FileSystemStorage',
     },
     'staticfiles': {
-        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+        'BACKEND': 'apps.pages.storage.BundledManifestStaticFilesStorage',
     },
 }
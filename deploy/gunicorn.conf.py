@@ -3,3 +3,6 @@ workers = 3
 timeout = 30
 accesslog = '/var/log/cmda/gunicorn-access.log'
 errorlog = '/var/log/cmda/gunicorn-error.log'
+# Send the workers' stderr (query warnings, and the per-request timing lines
+# when PAGES_TIMING_LOG_LEVEL=DEBUG) to errorlog
+capture_output = True
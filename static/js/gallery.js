@@ -1,14 +1,56 @@
 // Gallery lightbox — zero dependencies
+// Photos arrive in pages: the grid loads the next batch when it scrolls into
+// view and the lightbox fetches it when it gets close to the last loaded photo.
 (function () {
   const lightbox = document.getElementById('lightbox');
   if (!lightbox) return;
 
+  const grid = document.querySelector('.gallery-masonry');
   const img = document.getElementById('lightbox-img');
   const caption = document.getElementById('lightbox-caption');
   const counter = document.getElementById('lightbox-counter');
-  const items = Array.from(document.querySelectorAll('.gallery-item'));
+  const moreButton = document.querySelector('.gallery-load-more');
+  const total = parseInt(grid.dataset.total, 10) || 0;
+  const PREFETCH_DISTANCE = 3;
+  let items = Array.from(grid.querySelectorAll('.gallery-item'));
+  let cursor = moreButton ? moreButton.dataset.cursor : null;
+  let pending = null;
   let current = 0;
 
+  function loadMore() {
+    if (!cursor) return Promise.resolve();
+    if (pending) return pending;
+    moreButton.classList.add('is-loading');
+    pending = fetch(moreButton.dataset.url + '?after=' + encodeURIComponent(cursor))
+      .then(function (response) {
+        if (!response.ok) throw new Error('HTTP ' + response.status);
+        return response.json();
+      })
+      .then(function (data) {
+        grid.insertAdjacentHTML('beforeend', data.html);
+        items = Array.from(grid.querySelectorAll('.gallery-item'));
+        cursor = data.next_cursor;
+        if (cursor) {
+          moreButton.href = '?after=' + cursor;
+        } else {
+          moreButton.parentElement.remove();
+        }
+      })
+      .catch(function (error) {
+        console.error('Error loading photos:', error);
+      })
+      .finally(function () {
+        pending = null;
+        if (moreButton) moreButton.classList.remove('is-loading');
+      });
+    return pending;
+  }
+
+  function preload(index) {
+    const item = items[index];
+    if (item) new Image().src = item.querySelector('img').src;
+  }
+
   function open(index) {
     current = index;
     update();
@@ -28,26 +70,65 @@
     img.src = photo.src;
     img.alt = photo.alt;
     caption.textContent = cap ? cap.textContent : '';
-    counter.textContent = (current + 1) + ' / ' + items.length;
+    counter.textContent = (current + 1) + ' / ' + Math.max(total, items.length);
+
+    if (items.length - current <= PREFETCH_DISTANCE) loadMore();
+    preload(current + 1);
+    preload(current - 1);
   }
 
   function next() {
-    current = (current + 1) % items.length;
-    update();
+    if (current + 1 < items.length) {
+      current += 1;
+      update();
+    } else if (cursor) {
+      loadMore().then(function () {
+        if (current + 1 < items.length) {
+          current += 1;
+          update();
+        }
+      });
+    } else {
+      current = 0;
+      update();
+    }
   }
 
   function prev() {
-    current = (current - 1 + items.length) % items.length;
-    update();
+    // Wrapping to the last photo is only possible once every page is loaded
+    if (current > 0) {
+      current -= 1;
+      update();
+    } else if (!cursor) {
+      current = items.length - 1;
+      update();
+    }
   }
 
-  // Open on click
-  items.forEach(function (item, i) {
-    item.addEventListener('click', function () {
-      open(i);
-    });
+  // Open on click (delegated, so photos loaded later work too)
+  grid.addEventListener('click', function (e) {
+    const item = e.target.closest('.gallery-item');
+    if (item) open(items.indexOf(item));
   });
 
+  // Load more: button click, or automatically once it nears the viewport
+  if (moreButton) {
+    moreButton.addEventListener('click', function (e) {
+      e.preventDefault();
+      loadMore();
+    });
+    if ('IntersectionObserver' in window) {
+      const observer = new IntersectionObserver(function (entries) {
+        if (entries[0].isIntersecting) {
+          loadMore().then(function () {
+            if (!cursor) observer.disconnect();
+          });
+        }
+      }, { rootMargin: '600px 0px' });
+      observer.observe(moreButton);
+    }
+  }
+
   // Controls
   lightbox.querySelector('.lightbox-close').addEventListener('click', close);
   lightbox.querySelector('.lightbox-prev').addEventListener('click', prev);
@@ -1,7 +1,7 @@
 // Language Switcher Module
 const LanguageSwitcher = (function() {
-    let currentLanguage = localStorage.getItem('selectedLanguage') || 'ro';
-    let translations = {};
+    // Pages are rendered in the language Django picked from the django_language cookie
+    let currentLanguage = document.documentElement.lang || 'ro';
     let isOpen = false;
 
     const languages = [
@@ -11,66 +11,11 @@ const LanguageSwitcher = (function() {
         { code: 'uk', label: 'Українська' }
     ];
 
-    // Load translation files — current language first, others in background
-    async function loadTranslations() {
-        try {
-            const staticBase = window.STATIC_URL || '/static/';
-            const response = await fetch(`${staticBase}js/translations/${currentLanguage}.json`);
-            translations[currentLanguage] = await response.json();
-            const others = ['ro', 'en', 'ru', 'uk'].filter(l => l !== currentLanguage);
-            Promise.all(others.map(lang =>
-                fetch(`${staticBase}js/translations/${lang}.json`)
-                    .then(r => r.json())
-                    .then(data => { translations[lang] = data; })
-            )).catch(err => console.error('Error loading other translations:', err));
-        } catch (error) {
-            console.error('Error loading translations:', error);
-        }
-    }
-
-    // Update page content with translations
-    function updatePageContent(lang) {
-        const translation = translations[lang];
-        if (!translation) return;
-
-        document.querySelectorAll('[data-translate]').forEach(element => {
-            const keys = element.getAttribute('data-translate').split('.');
-            let value = translation;
-
-            for (const key of keys) {
-                value = value[key];
-                if (!value) break;
-            }
-
-            if (value) {
-                if (element.tagName === 'INPUT' || element.tagName === 'TEXTAREA') {
-                    element.placeholder = value;
-                } else {
-                    element.textContent = value;
-                }
-            }
-        });
-
-        if (document.querySelector('title')) {
-            const pageTitle = document.querySelector('title').getAttribute('data-title-key');
-            if (pageTitle && translation[pageTitle]) {
-                document.title = translation[pageTitle];
-            }
-        }
-
-        document.documentElement.lang = lang === 'ru' ? 'ru' : lang === 'en' ? 'en' : lang === 'uk' ? 'uk' : 'ro';
-    }
-
     // Initialize language switcher
     function init() {
-        // Sync cookie with stored language on every page load
-        setDjangoCookie(currentLanguage);
-        loadTranslations().then(() => {
-            if (!document.querySelector('.language-switcher')) {
-                addLanguageSwitcher();
-            }
-            updatePageContent(currentLanguage);
-        });
+        if (!document.querySelector('.language-switcher')) {
+            addLanguageSwitcher();
+        }
     }
 
     // Build the custom dropdown HTML
@@ -206,16 +151,14 @@ const LanguageSwitcher = (function() {
     function switchLanguage(lang) {
         const prevLang = currentLanguage;
         currentLanguage = lang;
-        localStorage.setItem('selectedLanguage', lang);
         setDjangoCookie(lang);
-        updatePageContent(lang);
 
         // Update all switcher instances
         document.querySelectorAll('.language-switcher').forEach(sw => {
             rebuildOptions(sw);
         });
 
-        // Reload page so Django serves DB content in the new language
+        // Reload page so Django renders it in the new language
         if (prevLang !== lang) {
             window.location.reload();
         }
@@ -15,14 +15,18 @@ document.addEventListener('DOMContentLoaded', function() {
                 const extras = document.createElement('div');
                 extras.className = 'mobile-menu-extras';
 
-                // Phone
+                // Phone, reusing the server-rendered icon of the header link
+                const phoneIcon = document.querySelector('.pre-header-phone i');
                 extras.innerHTML = `
                     <a href="tel:+37360314141" class="mobile-menu-phone">
-                        <i class="fas fa-phone"></i>
+                        ${phoneIcon ? phoneIcon.outerHTML : ''}
                         <span>+373 (60) 31-41-41</span>
                     </a>
-                    <a href="https://startup.chisinau.md" target="_blank" class="mobile-menu-cta" data-translate="nav.apply">Accesează programele</a>
+                    <a href="https://startup.chisinau.md" target="_blank" class="mobile-menu-cta"></a>
                 `;
+                // Reuse the server-translated label of the header CTA
+                const headerCta = document.querySelector('.cta-button');
+                extras.querySelector('.mobile-menu-cta').textContent = headerCta ? headerCta.textContent : 'Accesează programele';
 
                 // Language buttons
                 const langRow = document.createElement('div');
@@ -35,7 +39,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 ];
                 const currentLang = (typeof LanguageSwitcher !== 'undefined')
                     ? LanguageSwitcher.getCurrentLanguage()
-                    : (localStorage.getItem('selectedLanguage') || 'ro');
+                    : (document.documentElement.lang || 'ro');
 
                 langs.forEach(lang => {
                     const btn = document.createElement('button');
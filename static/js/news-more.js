@@ -0,0 +1,30 @@
+// "Load more" for the press releases listing: appends the next keyset page
+document.addEventListener('DOMContentLoaded', function() {
+    const button = document.querySelector('.news-load-more');
+    const grid = document.querySelector('.news-grid');
+    if (!button || !grid) return;
+
+    button.addEventListener('click', async function(e) {
+        e.preventDefault();
+        if (button.classList.contains('is-loading')) return;
+        button.classList.add('is-loading');
+        try {
+            const response = await fetch(`${button.dataset.url}?after=${encodeURIComponent(button.dataset.cursor)}`);
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            const data = await response.json();
+            grid.insertAdjacentHTML('beforeend', data.html);
+            if (typeof AOS !== 'undefined') AOS.refreshHard();
+            if (data.next_cursor) {
+                button.dataset.cursor = data.next_cursor;
+                button.href = `?after=${data.next_cursor}`;
+            } else {
+                button.parentElement.remove();
+            }
+        } catch (error) {
+            // Fall back to a full page load of the next page
+            window.location.href = button.href;
+        } finally {
+            button.classList.remove('is-loading');
+        }
+    });
+});